@@ -10,7 +10,7 @@ Usage:
 
 import argparse
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "results"))
@@ -32,7 +32,7 @@ def main():
     output_path = Path(args.output_dir) if args.output_dir else default_output_dir
     output_path.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     output_file = output_path / f"leaderboard-{timestamp}.json"
 
     config = load_config()
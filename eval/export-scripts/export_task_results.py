@@ -10,10 +10,31 @@ Usage:
 
 import argparse
 import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
 
-import yaml
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from helpers import (
+    ResponseSummary,
+    load_task_meta_index,
+    load_yaml,
+    scan_score_files,
+    summarize_response,
+)
+
+# Score/response files are small and IO-bound; read them on a thread pool
+LOAD_WORKERS = 8
+
+# Per-model export results, reused for runs whose score files are unchanged
+CACHE_DIR = Path(__file__).parent / ".cache"
+# Bump whenever the cached row shape or how rows are derived (error types,
+# provider mapping, rounding) changes, so stale caches are rebuilt
+RESULTS_CACHE_VERSION = 2
 
 
 def load_all_task_meta(tasks_dir: Path) -> dict[str, dict]:
@@ -24,43 +45,24 @@ def load_all_task_meta(tasks_dir: Path) -> dict[str, dict]:
     """
     tasks = {}
 
-    for task_path in sorted(tasks_dir.iterdir()):
-        if not task_path.is_dir() or task_path.name.startswith(("_", ".")):
+    for task_id, meta in load_task_meta_index(tasks_dir).items():
+        if task_id.startswith(("_", ".")):
             continue
 
-        task_id = task_path.name
-        meta_file = task_path / "meta.yaml"
+        task_meta = meta.get("task", {})
 
-        if not meta_file.exists():
-            continue
+        category = task_meta.get("category", [])
+        if isinstance(category, str):
+            category = [category]
 
-        try:
-            with open(meta_file) as f:
-                content = f.read().strip()
-
-            if not content or len(content) < 20:
-                continue
-
-            meta = yaml.safe_load(content)
-            if not isinstance(meta, dict):
-                continue
-
-            task_meta = meta.get("task", {})
-
-            category = task_meta.get("category", [])
-            if isinstance(category, str):
-                category = [category]
-
-            tasks[task_id] = {
-                "id": task_meta.get("id", task_id),
-                "title": task_meta.get("title", "TBD"),
-                "type": task_meta.get("type", "TBD"),
-                "category": category if category else [],
-                "input_type": task_meta.get("input_type", "TBD"),
-                "description": task_meta.get("description", None),
-            }
-        except (yaml.YAMLError, ValueError):
-            continue
+        tasks[task_id] = {
+            "id": task_meta.get("id", task_id),
+            "title": task_meta.get("title", "TBD"),
+            "type": task_meta.get("type", "TBD"),
+            "category": category if category else [],
+            "input_type": task_meta.get("input_type", "TBD"),
+            "description": task_meta.get("description", None),
+        }
 
     return tasks
 
@@ -72,12 +74,12 @@ def load_config(config_path: Path | None = None) -> dict:
         )
 
     if config_path.exists():
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml(config_path.read_bytes()) or {}
 
     return {}
 
 
+@cache
 def get_provider_from_model(model: str) -> str:
     model_lower = model.lower()
     if "claude" in model_lower:
@@ -89,8 +91,10 @@ def get_provider_from_model(model: str) -> str:
     return "unknown"
 
 
-def determine_error_type(score_data: dict, response_data: dict | None) -> str | None:
-    """Derive error_type from score/response data.
+def determine_error_type(
+    score_data: dict, response_summary: ResponseSummary | None
+) -> str | None:
+    """Derive error_type from score data and the summarized response.
 
     Returns:
         None (no error), "refused_by_provider", "incorrect_answer",
@@ -99,8 +103,8 @@ def determine_error_type(score_data: dict, response_data: dict | None) -> str |
     if score_data.get("blocked", False):
         return "refused_by_provider"
 
-    if response_data:
-        stop_reason = response_data.get("stop_reason", "")
+    if response_summary:
+        stop_reason = response_summary.get("stop_reason", "")
         if stop_reason == "content_filter":
             return "refused_by_provider"
 
@@ -108,33 +112,26 @@ def determine_error_type(score_data: dict, response_data: dict | None) -> str |
     if score_percent >= 90:
         return None
 
-    criteria = score_data.get("criteria", [])
-    has_programmatic_failure = False
+    # A programmatic failure outranks an LLM judge failure, so stop at the first
     has_llm_judge_failure = False
-
-    for criterion in criteria:
+    for criterion in score_data.get("criteria", []):
+        if criterion.get("passed", True):
+            continue
         criterion_type = criterion.get("type", "")
-        passed = criterion.get("passed", True)
-
-        if not passed:
-            if criterion_type == "programmatic":
-                has_programmatic_failure = True
-            elif criterion_type == "llm_judge":
-                has_llm_judge_failure = True
+        if criterion_type == "programmatic":
+            return "incorrect_answer"
+        if criterion_type == "llm_judge":
+            has_llm_judge_failure = True
 
-    if has_programmatic_failure:
-        return "incorrect_answer"
-    elif has_llm_judge_failure:
+    if has_llm_judge_failure:
         return "failed_by_llm_judge"
 
-    if response_data:
-        stop_reason = response_data.get("stop_reason", "")
+    if response_summary:
+        stop_reason = response_summary.get("stop_reason", "")
         if stop_reason == "max_tokens":
             return "other_error"
 
-        if response_data.get("parsed_response") is None and response_data.get(
-            "raw_response", ""
-        ):
+        if response_summary.get("parse_failed"):
             return "other_error"
 
     if score_percent < 90:
@@ -147,19 +144,17 @@ def load_run_config(run_dir: Path) -> dict:
     """Load config.json from a run directory."""
     config_file = run_dir / "config.json"
     if config_file.exists():
-        with open(config_file) as f:
-            return json.load(f)
+        return json.loads(config_file.read_bytes())
     return {}
 
 
-def parse_run_date(run_id: str, config: dict) -> str:
+@lru_cache(maxsize=4096)
+def parse_run_date(run_id: str, started_at: str = "") -> str:
     """Extract run date from run_id (YYYYMMDD_HHMMSS) or config.started_at."""
-    try:
-        return datetime.strptime(run_id.split("_")[0], "%Y%m%d").strftime("%Y-%m-%d")
-    except (ValueError, IndexError):
-        pass
+    date_part = run_id.partition("_")[0]
+    if len(date_part) == 8 and date_part.isdigit():
+        return f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:]}"
 
-    started_at = config.get("started_at", "")
     if started_at:
         try:
             return datetime.fromisoformat(started_at).strftime("%Y-%m-%d")
@@ -169,10 +164,68 @@ def parse_run_date(run_id: str, config: dict) -> str:
     return "unknown"
 
 
+def _load_json_file(path: str | Path) -> dict | None:
+    """Decode a JSON file, or None if it is missing or malformed."""
+    try:
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _load_result_files(
+    score_file: str, response_file: Path
+) -> tuple[dict | None, ResponseSummary | None]:
+    """Load a score file and the response fields it needs.
+
+    Newer score files carry a response_summary; older ones fall back to
+    reading the (much larger) response file.
+    """
+    score_data = _load_json_file(score_file)
+    if score_data is None:
+        return None, None
+    if "response_summary" in score_data:
+        return score_data, score_data["response_summary"]
+
+    response_data = _load_json_file(response_file)
+    if not response_data:
+        return score_data, None
+    return score_data, summarize_response(response_data)
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _run_fingerprint(entries: list, responses_run_dir: Path) -> list:
+    """Identify a run's scored state: score and response file mtimes plus config.json.
+
+    Response files count because score files without a response_summary are
+    summarized from them.
+    """
+    file_mtimes = sorted(
+        [e.name, e.stat().st_mtime_ns, _mtime_ns(responses_run_dir / e.name)]
+        for e in entries
+    )
+    return [_mtime_ns(responses_run_dir / "config.json"), file_mtimes]
+
+
 def get_model_results(
-    model_dir: Path, scores_dir: Path, responses_dir: Path
+    model_dir: Path,
+    scores_dir: Path,
+    responses_dir: Path,
+    cache_dir: Path | None = None,
 ) -> list[dict]:
-    """Get all task results for a model, aggregated across runs (latest per task)."""
+    """Get all task results for a model, aggregated across runs (latest per task).
+
+    With cache_dir set, per-run results are cached in
+    cache_dir/results-<model>.json and reused while the run's score and
+    response files and config.json are unchanged and the cache matches
+    RESULTS_CACHE_VERSION.
+    """
     model = model_dir.name
     model_scores_dir = scores_dir / model
     model_responses_dir = responses_dir / model
@@ -184,54 +237,85 @@ def get_model_results(
     if not runs:
         return []
 
-    results_by_task: dict[str, dict] = {}
+    cache_file = cache_dir / f"results-{model}.json" if cache_dir else None
+    cached = (_load_json_file(cache_file) if cache_file else None) or {}
+    cached_runs: dict[str, dict] = (
+        cached.get("runs", {}) if cached.get("version") == RESULTS_CACHE_VERSION else {}
+    )
 
+    # run_id -> {"fingerprint": ..., "results": {task_id: result}}
+    run_results: dict[str, dict] = {}
+
+    # (task_id, score_file, response_file, run_id, provider, run_date) in run order
+    jobs: list[tuple[str, str, Path, str, str, str]] = []
+    default_provider = get_provider_from_model(model)
     for run_dir in runs:
         run_id = run_dir.name
         responses_run_dir = model_responses_dir / run_id
+        entries = scan_score_files(run_dir)
+
+        fingerprint = _run_fingerprint(entries, responses_run_dir)
+        cached_run = cached_runs.get(run_id)
+        if cached_run and cached_run.get("fingerprint") == fingerprint:
+            run_results[run_id] = cached_run
+            continue
+        run_results[run_id] = {"fingerprint": fingerprint, "results": {}}
+
         config = load_run_config(responses_run_dir)
-        provider = config.get("provider") or get_provider_from_model(model)
-        run_date = parse_run_date(run_id, config)
+        provider = config.get("provider") or default_provider
+        run_date = parse_run_date(run_id, config.get("started_at", ""))
+
+        for entry in entries:
+            task_id = entry.name.removesuffix(".json")
+            response_file = responses_run_dir / entry.name
+            jobs.append(
+                (task_id, entry.path, response_file, run_id, provider, run_date)
+            )
+
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+        loaded = list(
+            pool.map(
+                _load_result_files,
+                [job[1] for job in jobs],
+                [job[2] for job in jobs],
+            )
+        )
 
-        for score_file in run_dir.glob("*.json"):
-            if score_file.name == "summary.json":
-                continue
+    for job, (score_data, response_summary) in zip(jobs, loaded):
+        task_id, _, _, run_id, provider, run_date = job
+        if score_data is None:
+            continue
 
-            task_id = score_file.stem
+        execution_time_ms = None
+        if response_summary:
+            execution_time_ms = response_summary.get("latency_ms")
+            if execution_time_ms is not None:
+                execution_time_ms = round(execution_time_ms)
+
+        error_type = determine_error_type(score_data, response_summary)
+
+        run_results[run_id]["results"][task_id] = {
+            "task_id": task_id,
+            "model": model,
+            "provider": provider,
+            "score": round(score_data.get("score_percent", 0)),
+            "execution_time_ms": execution_time_ms,
+            "run_id": run_id,
+            "run_date": run_date,
+            "error_type": error_type,
+        }
 
-            try:
-                with open(score_file) as f:
-                    score_data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                continue
+    if cache_file and (jobs or run_results.keys() != cached_runs.keys()):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"version": RESULTS_CACHE_VERSION, "runs": run_results})
+        )
 
-            response_data = None
-            response_file = responses_run_dir / f"{task_id}.json"
-            if response_file.exists():
-                try:
-                    with open(response_file) as f:
-                        response_data = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    pass
-
-            execution_time_ms = None
-            if response_data and "usage" in response_data:
-                execution_time_ms = response_data["usage"].get("latency_ms")
-                if execution_time_ms is not None:
-                    execution_time_ms = round(execution_time_ms)
-
-            error_type = determine_error_type(score_data, response_data)
-
-            results_by_task[task_id] = {
-                "task_id": task_id,
-                "model": model,
-                "provider": provider,
-                "score": round(score_data.get("score_percent", 0)),
-                "execution_time_ms": execution_time_ms,
-                "run_id": run_id,
-                "run_date": run_date,
-                "error_type": error_type,
-            }
+    # Later runs override earlier ones per task
+    results_by_task: dict[str, dict] = {}
+    for run_dir in runs:
+        for task_id, result in run_results[run_dir.name]["results"].items():
+            results_by_task[task_id] = dict(result)
 
     return list(results_by_task.values())
 
@@ -262,7 +346,9 @@ def export_task_results(output_dir: str | None = None) -> Path:
             if allowed_models and model_dir.name not in allowed_models:
                 continue
 
-            model_results = get_model_results(model_dir, scores_dir, responses_dir)
+            model_results = get_model_results(
+                model_dir, scores_dir, responses_dir, cache_dir=CACHE_DIR
+            )
 
             for result in model_results:
                 task_id = result.pop("task_id")
@@ -291,11 +377,11 @@ def export_task_results(output_dir: str | None = None) -> Path:
         "model_count": len(models_seen),
     }
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     output_file = output_path / f"task_results-{timestamp}.json"
 
-    with open(output_file, "w") as f:
-        json.dump(output, f, indent=2)
+    # json.dump writes each encoder chunk separately; encode once, write once
+    output_file.write_text(json.dumps(output, indent=2))
 
     print(f"Exported {len(tasks)} tasks with results from {len(models_seen)} models")
     print(f"Output: {output_file}")
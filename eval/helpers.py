@@ -4,11 +4,14 @@ Shared utilities for the IB-bench evaluation pipeline.
 
 import hashlib
 import json
+import os
 import re
 import time
-from dataclasses import dataclass
-from datetime import datetime
-from functools import wraps
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any, Literal, TypedDict, cast
 
@@ -61,6 +64,14 @@ class TaskMeta(TypedDict, total=False):
     description: str
 
 
+class ResponseSummary(TypedDict, total=False):
+    """Response fields copied into score files so exports can skip responses."""
+
+    latency_ms: float | None
+    stop_reason: str
+    parse_failed: bool
+
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 
@@ -86,36 +97,94 @@ TRANSIENT_ERROR_PATTERNS = [
 ]
 
 
-def _is_transient_error(error_str: str) -> bool:
-    error_lower = error_str.lower()
+_TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _is_transient_error(error_lower: str) -> bool:
     return any(pattern in error_lower for pattern in TRANSIENT_ERROR_PATTERNS)
 
 
+def _is_rate_limit_error(error_lower: str) -> bool:
+    return (
+        "429" in error_lower
+        or "rate_limit" in error_lower
+        or "rate limit" in error_lower
+    )
+
+
+def _classify_error(error: Exception) -> tuple[bool, bool]:
+    """Return (transient, rate_limited) for an exception.
+
+    SDK errors carry the HTTP status as an attribute (status_code for
+    Anthropic/OpenAI/Azure, an int code for google-genai), so check that
+    before falling back to scanning the (possibly long) lowercased message.
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    if isinstance(status, int) and status in _TRANSIENT_STATUS_CODES:
+        return True, status == 429
+    error_lower = str(error).lower()
+    return _is_transient_error(error_lower), _is_rate_limit_error(error_lower)
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read a numeric Retry-After header from an SDK error's HTTP response."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+# Monotonic deadline per decorated function (e.g. "AnthropicRunner.run") before
+# which new calls hold off, so parallel tasks back off together after a 429
+_rate_limited_until: dict[str, float] = {}
+
+
 def retry_on_rate_limit(max_retries: int = 3, initial_wait: int = 60):
     """Decorator to retry on transient errors with exponential backoff.
 
     Handles: rate limits (429), timeouts (408), server errors (500/502/503/504),
-    and connection errors.
+    and connection errors. A Retry-After header on the error, when present,
+    replaces the backoff wait, and a rate limit pauses new calls to the same
+    function until it expires.
     """
 
     def decorator(func):
+        key = func.__qualname__
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
             wait_time = initial_wait
 
+            pause = _rate_limited_until.get(key, 0.0) - time.monotonic()
+            if pause > 0:
+                print(f"  Rate limited; waiting {pause:.0f}s before calling...")
+                time.sleep(pause)
+
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    error_str = str(e)
-                    if _is_transient_error(error_str):
+                    transient, rate_limited = _classify_error(e)
+                    if transient:
                         last_exception = e
                         if attempt < max_retries:
+                            retry_after = _retry_after_seconds(e)
+                            wait = wait_time if retry_after is None else retry_after
+                            if rate_limited:
+                                _rate_limited_until[key] = max(
+                                    _rate_limited_until.get(key, 0.0),
+                                    time.monotonic() + wait,
+                                )
                             print(
-                                f"  Transient error: {type(e).__name__}. Waiting {wait_time}s before retry ({attempt + 1}/{max_retries})..."
+                                f"  Transient error: {type(e).__name__}. Waiting {wait}s before retry ({attempt + 1}/{max_retries})..."
                             )
-                            time.sleep(wait_time)
+                            time.sleep(wait)
                             wait_time *= 2
                         else:
                             print(
@@ -134,7 +203,19 @@ def retry_on_rate_limit(max_retries: int = 3, initial_wait: int = 60):
     return decorator
 
 
-@dataclass
+# C-accelerated loader when PyYAML was built against libyaml
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(data: str | bytes) -> Any:
+    """Safe-load a YAML document, using libyaml's C parser when available."""
+    return yaml.load(data, Loader=_YamlLoader)
+
+
+TASK_FILES = ("meta.yaml", "prompt.md", "rubric.json")
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a single evaluation task."""
 
@@ -146,14 +227,48 @@ class Task:
     prompt: str
     rubric: Rubric
     input_files: list[Path]
+    rubric_hash: str = field(init=False)
+
+    def __post_init__(self):
+        # Hashed once here (tasks are cached) instead of on every score write
+        self.rubric_hash = get_rubric_hash(self.rubric)
+
+
+def _scan_task_dir(task_dir: Path) -> tuple[tuple[int, ...], tuple[Path, ...]]:
+    """Read a task directory once.
+
+    Returns the mtimes of TASK_FILES (-1 when missing) and the input*.* files.
+    """
+    mtimes = dict.fromkeys(TASK_FILES, -1)
+    input_files = []
+    with os.scandir(task_dir) as it:
+        for e in it:
+            if e.name in mtimes:
+                mtimes[e.name] = e.stat().st_mtime_ns
+            elif e.name.startswith("input") and "." in e.name[5:] and e.is_file():
+                input_files.append(Path(e.path))
+    return tuple(mtimes.values()), tuple(input_files)
 
 
 def load_task(task_dir: Path, include_rubric: bool = True) -> Task:
-    """Load a single task from a directory."""
+    """Load a single task from a directory.
+
+    Results are cached in-process until one of the task's files changes.
+    """
+    mtimes, input_files = _scan_task_dir(task_dir)
+    return _load_task_cached(task_dir, include_rubric, mtimes, input_files)
+
+
+@lru_cache(maxsize=1024)
+def _load_task_cached(
+    task_dir: Path,
+    include_rubric: bool,
+    mtimes: tuple[int, ...],
+    input_files: tuple[Path, ...],
+) -> Task:
     # Parse meta.yaml
     meta_path = task_dir / "meta.yaml"
-    with open(meta_path) as f:
-        meta = yaml.safe_load(f)
+    meta = load_yaml(meta_path.read_bytes())
 
     # Skip if meta.yaml is not a proper dict (e.g., just a comment blurb)
     if not isinstance(meta, dict):
@@ -165,18 +280,14 @@ def load_task(task_dir: Path, include_rubric: bool = True) -> Task:
 
     # Read prompt
     prompt_path = task_dir / "prompt.md"
-    prompt = prompt_path.read_text()
+    prompt = prompt_path.read_bytes().decode("utf-8")
 
     # Read rubric (only if needed for scoring)
     rubric: Rubric = cast(Rubric, {})
     if include_rubric:
         rubric_path = task_dir / "rubric.json"
         if rubric_path.exists():
-            with open(rubric_path) as f:
-                rubric = cast(Rubric, json.load(f))
-
-    # Find input files (glob pattern: input*.*)
-    input_files = list(task_dir.glob("input*.*"))
+            rubric = cast(Rubric, json.loads(rubric_path.read_bytes()))
 
     return Task(
         id=task_meta.get("id"),
@@ -186,7 +297,7 @@ def load_task(task_dir: Path, include_rubric: bool = True) -> Task:
         description=task_meta.get("description", ""),
         prompt=prompt,
         rubric=rubric,
-        input_files=input_files,
+        input_files=list(input_files),
     )
 
 
@@ -210,37 +321,135 @@ def load_tasks(
     if tasks_dir is None:
         tasks_dir = Path(__file__).parent / "tasks"
 
-    tasks = []
-
-    for task_path in sorted(tasks_dir.iterdir()):
-        if not task_path.is_dir():
-            continue
+    if task_ids:
+        # Explicit IDs: stat each one directly instead of listing the whole
+        # tasks directory (only plain directory names can match, as before)
+        names = sorted(
+            tid
+            for tid in set(task_ids)
+            if tid not in (".", "..") and Path(tid).name == tid
+        )
+    else:
+        # DirEntry.is_dir() reuses the type info from the directory listing
+        with os.scandir(tasks_dir) as it:
+            names = sorted(e.name for e in it if e.is_dir())
 
-        task_id = task_path.name
+    # Filter by pattern if provided
+    if filter_pattern:
+        names = [name for name in names if name.startswith(filter_pattern)]
 
-        # Filter by task_ids if provided
-        if task_ids and task_id not in task_ids:
-            continue
+    candidates = [tasks_dir / name for name in names]
+    if task_ids:
+        candidates = [path for path in candidates if path.is_dir()]
 
-        # Filter by pattern if provided
-        if filter_pattern and not task_id.startswith(filter_pattern):
-            continue
+    if not candidates:
+        return []
 
+    def _load(task_path: Path) -> Task | Exception:
         try:
-            task = load_task(task_path, include_rubric=include_rubric)
-            tasks.append(task)
+            return load_task(task_path, include_rubric=include_rubric)
         except (FileNotFoundError, ValueError) as e:
-            print(f"Warning: Skipping {task_path.name}: {e}")
+            return e
+
+    # Loading is dominated by file reads, so overlap them across threads;
+    # map() keeps results (and warnings) in sorted directory order
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as pool:
+        loaded = list(pool.map(_load, candidates))
+
+    tasks = []
+    for task_path, result in zip(candidates, loaded):
+        if isinstance(result, Exception):
+            print(f"Warning: Skipping {task_path.name}: {result}")
+        else:
+            tasks.append(result)
 
     return tasks
 
 
+TASK_META_CACHE = "_meta_cache.json"
+
+
+def load_task_meta_index(tasks_dir: Path | None = None) -> dict[str, dict]:
+    """Load parsed meta.yaml for every task, via a JSON sidecar cache.
+
+    The cache (tasks/_meta_cache.json) records each meta.yaml mtime and is
+    rebuilt whenever a task is added, removed or edited. Tasks whose meta.yaml
+    is missing, invalid YAML or not a mapping are left out.
+
+    Returns:
+        Dict mapping task directory name to its full meta.yaml dict.
+    """
+    if tasks_dir is None:
+        tasks_dir = Path(__file__).parent / "tasks"
+
+    mtimes: dict[str, int] = {}
+    for task_path in sorted(tasks_dir.iterdir()):
+        meta_path = task_path / "meta.yaml"
+        if task_path.is_dir() and meta_path.exists():
+            mtimes[task_path.name] = meta_path.stat().st_mtime_ns
+
+    cache_path = tasks_dir / TASK_META_CACHE
+    if cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached.get("mtimes") == mtimes:
+                return cached["meta"]
+        except (ValueError, KeyError, AttributeError):
+            pass
+
+    index: dict[str, dict] = {}
+    for task_id in mtimes:
+        try:
+            meta = load_yaml((tasks_dir / task_id / "meta.yaml").read_bytes())
+        except yaml.YAMLError:
+            continue
+        if isinstance(meta, dict):
+            index[task_id] = meta
+
+    # Return the index as it reads back from the cache, so YAML values JSON
+    # cannot hold (dates, non-string keys) have the same type on warm loads
+    serialized = json.dumps({"mtimes": mtimes, "meta": index}, default=str)
+    # Write then rename, so readers never see a partially written cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(serialized)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+    return json.loads(serialized)["meta"]
+
+
 def get_rubric_hash(rubric: Rubric) -> str:
     """Generate 8-char hash of rubric content for versioning."""
     content = json.dumps(rubric, sort_keys=True)
     return hashlib.sha256(content.encode()).hexdigest()[:8]
 
 
+def scan_score_files(run_dir: Path) -> list[os.DirEntry]:
+    """List per-task score files in a run directory (excludes summary.json).
+
+    Uses os.scandir so no Path objects or extra stat calls are needed;
+    entries come back in directory order.
+    """
+    with os.scandir(run_dir) as it:
+        return [
+            entry
+            for entry in it
+            if entry.name.endswith(".json") and entry.name != "summary.json"
+        ]
+
+
+def summarize_response(response_data: dict) -> ResponseSummary:
+    """Extract the response fields exports need from a response JSON."""
+    return {
+        "latency_ms": (response_data.get("usage") or {}).get("latency_ms"),
+        "stop_reason": response_data.get("stop_reason", ""),
+        "parse_failed": response_data.get("parsed_response") is None
+        and bool(response_data.get("raw_response", "")),
+    }
+
+
 def _sanitize_json_strings(text: str) -> str:
     """Escape raw newlines/tabs inside JSON string values (Mistral outputs these)."""
     result = []
@@ -275,18 +484,31 @@ def _sanitize_json_strings(text: str) -> str:
     return "".join(result)
 
 
+_LINE_COMMENT_RE = re.compile(r"//.*?(?=\n|$)")
+
+
 def _strip_json_comments(text: str) -> str:
-    return re.sub(r"//.*?(?=\n|$)", "", text)
+    return _LINE_COMMENT_RE.sub("", text)
+
+
+def _json_candidates(text: str) -> Iterator[str]:
+    """Yield progressively repaired variants of text, skipping no-op repairs."""
+    yield text
+    stripped = _strip_json_comments(text)
+    if stripped != text:
+        yield stripped
+    sanitized = _sanitize_json_strings(text)
+    if sanitized != text:
+        yield sanitized
+    if stripped != text:
+        sanitized_stripped = _sanitize_json_strings(stripped)
+        if sanitized_stripped != stripped:
+            yield sanitized_stripped
 
 
 def _try_parse_json(text: str) -> dict[str, Any] | None:
-    candidates = [
-        text,
-        _strip_json_comments(text),
-        _sanitize_json_strings(text),
-        _sanitize_json_strings(_strip_json_comments(text)),
-    ]
-    for candidate in candidates:
+    # Repairs are only computed once the cheaper candidates have failed
+    for candidate in _json_candidates(text):
         try:
             return json.loads(candidate)
         except json.JSONDecodeError:
@@ -300,12 +522,47 @@ def _try_parse_json(text: str) -> dict[str, Any] | None:
     return None
 
 
+# A whole (possibly unterminated) string literal, or a single brace
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]+|\\.)*"?|[{}]', re.DOTALL)
+
+
+def _find_balanced_json(text: str, start: int) -> tuple[int, int]:
+    """Scan from the "{" at start, ignoring braces inside string literals.
+
+    Returns (end, depth): end is the index of the closing "}", or -1 if the text
+    runs out first, in which case depth is the number of unclosed braces.
+    """
+    depth = 0
+    # The regex skips over string literals and plain text in C, so the loop
+    # only sees braces and strings
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return match.start(), 0
+    return -1, depth
+
+
+_JSON_DECODER = json.JSONDecoder()
+_FIRST_NON_WS_RE = re.compile(r"\S")
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
 def extract_json(text: str) -> dict[str, Any] | None:
-    result = _try_parse_json(text.strip())
-    if result:
-        return result
+    # Most responses are prose around a JSON block; only try parsing the whole
+    # text (and its repaired variants) when it opens as an object or with a
+    # // comment that the repairs strip. Probe past leading whitespace in
+    # place so prose never gets copied.
+    first = _FIRST_NON_WS_RE.search(text)
+    if first is not None and first.group() in ("{", "/"):
+        result = _try_parse_json(text.strip())
+        if result:
+            return result
 
-    code_block = re.search(r"```(?:json)?\s*(.*?)\s*```", text, re.DOTALL)
+    code_block = _CODE_BLOCK_RE.search(text) if "```" in text else None
     if code_block:
         result = _try_parse_json(code_block.group(1))
         if result:
@@ -315,27 +572,28 @@ def extract_json(text: str) -> dict[str, Any] | None:
     if start == -1:
         return None
 
-    depth = 0
-    for i, char in enumerate(text[start:], start):
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                result = _try_parse_json(text[start : i + 1])
-                if result:
-                    return result
-                break
+    # A well-formed object is decoded straight from the text by the C decoder;
+    # only malformed ones need the brace scan and repairs
+    try:
+        return _JSON_DECODER.raw_decode(text, start)[0]
+    except json.JSONDecodeError:
+        pass
 
+    end, depth = _find_balanced_json(text, start)
+    if end != -1:
+        return _try_parse_json(text[start : end + 1])
     if depth > 0:
         return _try_parse_json(text[start:] + "}" * depth)
 
     return None
 
 
+_TASK_SECTION_RE = re.compile(r"## Task\s*\n(.*?)(?=\n## |\Z)", re.DOTALL)
+
+
 def extract_task_section(prompt: str) -> str:
     """Extract the ## Task section from a prompt.md file."""
-    match = re.search(r"## Task\s*\n(.*?)(?=\n## |\Z)", prompt, re.DOTALL)
+    match = _TASK_SECTION_RE.search(prompt)
     if not match:
         raise ValueError("Prompt missing required '## Task' section")
     return match.group(1).strip()
@@ -347,6 +605,18 @@ def _truncate_text(text: str, max_len: int = 300) -> str:
     return text[: max_len - 3] + "..."
 
 
+_ERROR_ATTRS = (
+    "status_code",
+    "status",
+    "code",
+    "type",
+    "request_id",
+    "param",
+    "retryable",
+)
+_MAX_RESPONSE_BODY = 2000
+
+
 def extract_error_details(error: Exception) -> dict[str, Any]:
     """Extract useful, JSON-serializable error details from API exceptions."""
     details: dict[str, Any] = {
@@ -354,37 +624,38 @@ def extract_error_details(error: Exception) -> dict[str, Any]:
         "message": str(error) or repr(error),
     }
 
-    for attr in ("status_code", "status", "code", "type", "request_id", "param"):
+    for attr in _ERROR_ATTRS:
         value = getattr(error, attr, None)
         if value not in (None, ""):
             details[attr] = value
 
-    retryable = getattr(error, "retryable", None)
-    if retryable is not None:
-        details["retryable"] = retryable
-
     body = getattr(error, "body", None)
     if body not in (None, ""):
-        details["response_body"] = body
+        details["response_body"] = _truncate_text(str(body), _MAX_RESPONSE_BODY)
 
     response = getattr(error, "response", None)
-    if response is not None:
+    if response is None:
+        return details
+
+    if "status_code" not in details:
         status_code = getattr(response, "status_code", None)
-        if status_code and "status_code" not in details:
+        if status_code:
             details["status_code"] = status_code
 
+    if "request_id" not in details:
         headers = getattr(response, "headers", None)
-        if headers and "request_id" not in details:
-            request_id = headers.get("x-request-id") or headers.get("request-id")
-            if request_id:
-                details["request_id"] = request_id
+        request_id = headers and (
+            headers.get("x-request-id") or headers.get("request-id")
+        )
+        if request_id:
+            details["request_id"] = request_id
 
+    if "response_body" not in details:
         response_text = getattr(response, "text", None)
-        if response_text and "response_body" not in details:
-            details["response_body"] = response_text
-
-    if "response_body" in details:
-        details["response_body"] = _truncate_text(str(details["response_body"]), 2000)
+        if response_text:
+            details["response_body"] = _truncate_text(
+                str(response_text), _MAX_RESPONSE_BODY
+            )
 
     return details
 
@@ -416,39 +687,51 @@ def format_error_summary(details: dict[str, Any], verbose: bool = False) -> str:
     return " | ".join(parts)
 
 
+# (message pattern, status codes, steps); the first matching rule wins.
+_NEXT_STEP_RULES: tuple[
+    tuple[re.Pattern[str], frozenset[str], tuple[str, ...]], ...
+] = (
+    (
+        re.compile(r"rate limit"),
+        frozenset({"429"}),
+        ("Reduce --parallel and retry later", "Check provider quota limits"),
+    ),
+    (
+        re.compile(r"api key|authentication"),
+        frozenset({"401", "403"}),
+        (
+            "Verify API key environment variables (.env or shell)",
+            "Check account permissions for the model",
+        ),
+    ),
+    (
+        re.compile(r"not found.*model|model.*not found", re.DOTALL),
+        frozenset(),
+        ("Verify the model name in the config",),
+    ),
+    (
+        re.compile(r"timeout|timed out"),
+        frozenset(),
+        ("Retry the request", "Reduce input size or lower --parallel"),
+    ),
+    (
+        re.compile(r"invalid"),
+        frozenset({"400"}),
+        ("Inspect task prompt and input files for invalid content",),
+    ),
+)
+
+
 def suggest_next_steps(details: dict[str, Any]) -> list[str]:
     """Suggest next steps based on error details."""
     message = str(details.get("message", "")).lower()
     status_code = str(details.get("status_code") or details.get("status") or "")
 
-    steps = []
-
-    if "rate limit" in message or status_code == "429":
-        steps.append("Reduce --parallel and retry later")
-        steps.append("Check provider quota limits")
-    elif (
-        "api key" in message
-        or "authentication" in message
-        or status_code
-        in {
-            "401",
-            "403",
-        }
-    ):
-        steps.append("Verify API key environment variables (.env or shell)")
-        steps.append("Check account permissions for the model")
-    elif "not found" in message and "model" in message:
-        steps.append("Verify the model name in the config")
-    elif "timeout" in message or "timed out" in message:
-        steps.append("Retry the request")
-        steps.append("Reduce input size or lower --parallel")
-    elif "invalid" in message or status_code == "400":
-        steps.append("Inspect task prompt and input files for invalid content")
-
-    if not steps:
-        steps.append("Re-run with --verbose to see full error details")
-
-    return steps
+    for pattern, status_codes, steps in _NEXT_STEP_RULES:
+        if status_code in status_codes or pattern.search(message):
+            return list(steps)
+
+    return ["Re-run with --verbose to see full error details"]
 
 
 def build_error_report(
@@ -463,7 +746,9 @@ def build_error_report(
     return details, summary, next_steps
 
 
-def get_runner(provider: Provider, model: str, **kwargs):
+@lru_cache(maxsize=1)
+def _runner_classes() -> dict[str, type]:
+    """Provider -> runner class map, built on first use (imports the SDK wrappers)."""
     from runners import (
         AnthropicRunner,
         AzureAgentRunner,
@@ -472,7 +757,7 @@ def get_runner(provider: Provider, model: str, **kwargs):
         OpenAIRunner,
     )
 
-    runners = {
+    return {
         "anthropic": AnthropicRunner,
         "openai": OpenAIRunner,
         "gemini": GeminiRunner,
@@ -480,7 +765,9 @@ def get_runner(provider: Provider, model: str, **kwargs):
         "azure-v2": AzureAgentRunnerV2,
     }
 
-    runner_class = runners.get(provider)
+
+def get_runner(provider: Provider, model: str, **kwargs):
+    runner_class = _runner_classes().get(provider)
     if runner_class is None:
         raise ValueError(f"Unknown provider: {provider}")
     if provider == "azure-v2":
@@ -493,7 +780,7 @@ def create_run_directory(model: str, base_dir: Path | None = None) -> Path:
     if base_dir is None:
         base_dir = Path(__file__).parent / "responses"
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     # Sanitize model name for filesystem
     model_safe = model.replace("/", "-").replace(":", "-")
     run_dir = base_dir / model_safe / timestamp
@@ -503,6 +790,32 @@ def create_run_directory(model: str, base_dir: Path | None = None) -> Path:
     return run_dir
 
 
+# Raw bytes of the error values check_workbook_errors reports. An error cell or a
+# string cell holding one always contains its literal token in the package XML.
+_XLSX_ERROR_TOKEN_RE = re.compile(rb"#(?:REF!|VALUE!|NAME\?|DIV/0!|NULL!|N/A|NUM!)")
+
+
+_WORKBOOK_ERROR_VALUES = frozenset(
+    {"#REF!", "#VALUE!", "#NAME?", "#DIV/0!", "#NULL!", "#N/A", "#NUM!"}
+)
+
+
+def _xlsx_may_contain_errors(xlsx_path: Path) -> bool:
+    """Cheap pre-check: False only if no part of the xlsx package has an error token."""
+    try:
+        with zipfile.ZipFile(xlsx_path) as z:
+            names = z.namelist()
+            if "xl/workbook.xml" not in names:
+                return True
+            return any(
+                _XLSX_ERROR_TOKEN_RE.search(z.read(name))
+                for name in names
+                if name.endswith(".xml")
+            )
+    except (OSError, zipfile.BadZipFile):
+        return True
+
+
 def check_workbook_errors(xlsx_path: Path) -> tuple[bool, list[str]]:
     """
     Check if workbook contains any #REF! or other formula errors.
@@ -510,43 +823,57 @@ def check_workbook_errors(xlsx_path: Path) -> tuple[bool, list[str]]:
     :param xlsx_path: Path to Excel file
     :returns: (has_errors, list of error descriptions)
     """
+    # Most workbooks are clean; only load them with openpyxl (for cell
+    # coordinates) when an error token appears somewhere in the raw XML
+    if not _xlsx_may_contain_errors(xlsx_path):
+        return False, []
+
     import openpyxl
+    from openpyxl.utils import get_column_letter
 
     try:
-        wb = openpyxl.load_workbook(xlsx_path, data_only=False)
+        # read_only streams rows as plain values instead of building Cell objects
+        wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=False)
     except Exception as e:
         return True, [f"Failed to open Excel file: {e}"]
 
     try:
         errors = []
-        error_values = {
-            "#REF!",
-            "#VALUE!",
-            "#NAME?",
-            "#DIV/0!",
-            "#NULL!",
-            "#N/A",
-            "#NUM!",
-        }
 
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value in error_values:
-                        errors.append(f"{sheet_name}!{cell.coordinate}: {cell.value}")
+            rows = ws.iter_rows(min_row=1, min_col=1, values_only=True)
+            for row_idx, row in enumerate(rows, 1):
+                for col_idx, value in enumerate(row, 1):
+                    if value in _WORKBOOK_ERROR_VALUES:
+                        coord = f"{get_column_letter(col_idx)}{row_idx}"
+                        errors.append(f"{sheet_name}!{coord}: {value}")
 
         return len(errors) > 0, errors
     finally:
         wb.close()
 
 
+def load_values_workbook(xlsx_path: Path, read_only: bool = False) -> Any:
+    """Open a workbook with computed (cached) cell values, as check_cell_value reads it.
+
+    read_only streams cells from the sheet XML instead of building the whole
+    workbook in memory, but re-reads the sheet from the top on every cell
+    lookup: use it for a single lookup, and a full load for workbooks shared
+    across many. Call close() to release the file.
+    """
+    import openpyxl
+
+    return openpyxl.load_workbook(xlsx_path, data_only=True, read_only=read_only)
+
+
 def check_cell_value(
     xlsx_path: Path,
     cell: str,
     expected: float | str,
     sheet: str | None = None,
     tolerance: float = 0,
+    wb: Any = None,
 ) -> tuple[bool, Any, str]:
     """
     Check if cell equals expected value within tolerance.
@@ -556,16 +883,18 @@ def check_cell_value(
     :param expected: Expected value (numeric with tolerance, or string for exact match)
     :param sheet: Sheet name (defaults to active sheet)
     :param tolerance: Allowed difference for numeric (default 0 = exact match)
+    :param wb: Workbook already opened with load_values_workbook (left open);
+        when omitted, xlsx_path is opened and closed here
     :returns: (passed, actual_value, details)
 
     Does not handle: Named ranges, formulas (reads computed values only).
     """
-    import openpyxl
-
-    try:
-        wb = openpyxl.load_workbook(xlsx_path, data_only=True)
-    except Exception as e:
-        return False, None, f"Failed to open Excel file: {e}"
+    owns_wb = wb is None
+    if owns_wb:
+        try:
+            wb = load_values_workbook(xlsx_path, read_only=True)
+        except Exception as e:
+            return False, None, f"Failed to open Excel file: {e}"
 
     try:
         try:
@@ -608,7 +937,8 @@ def check_cell_value(
 
         return passed, actual_num, details
     finally:
-        wb.close()
+        if owns_wb:
+            wb.close()
 
 
 BLUE_RGB = "0000FF"
@@ -621,11 +951,15 @@ RED_THEME_INDICES = {1, 2}
 
 def _is_font_color(font, rgb_suffix: str, theme_indices: set[int]) -> bool:
     """Check if font matches a color by RGB suffix or theme index."""
-    if font.color is None:
+    color = font.color
+    if color is None:
         return False
-    if font.color.rgb and str(font.color.rgb).upper().endswith(rgb_suffix):
+    # Only the last six hex digits matter; compare that slice instead of
+    # uppercasing the whole ARGB string
+    rgb = color.rgb
+    if rgb and str(rgb)[-6:].upper() == rgb_suffix:
         return True
-    return font.color.theme in theme_indices
+    return color.theme in theme_indices
 
 
 def _is_blue(font) -> bool:
@@ -640,18 +974,29 @@ def _is_red(font) -> bool:
     return _is_font_color(font, RED_RGB, RED_THEME_INDICES)
 
 
-def _has_external_workbook_ref(formula: str) -> bool:
-    """Detect [workbook.xlsx]Sheet!Cell syntax."""
-    if not formula or not isinstance(formula, str):
-        return False
-    return "[" in formula and "]" in formula
+def _classify_formula_ref(formula: str) -> Literal["external", "cross_sheet"] | None:
+    """Classify a formula's references in one pass.
 
+    "external": [workbook.xlsx]Sheet!Cell syntax
+    "cross_sheet": Sheet!Cell syntax (same workbook, different sheet)
+    """
+    if "[" in formula and "]" in formula:
+        return "external"
+    if "!" in formula:
+        return "cross_sheet"
+    return None
 
-def _has_cross_sheet_ref(formula: str) -> bool:
-    """Detect Sheet!Cell syntax (same workbook, different sheet)."""
-    if not formula or not isinstance(formula, str):
-        return False
-    return "!" in formula and not _has_external_workbook_ref(formula)
+
+@lru_cache(maxsize=4)
+def _load_formula_workbook(path: str, mtime_ns: int, size: int) -> Any:
+    """Load a full (formulas + styles) workbook, reused while the file is unchanged.
+
+    Several formatting criteria usually target the same output file. The
+    in-memory model holds no file handle, so cached workbooks need no close().
+    """
+    import openpyxl
+
+    return openpyxl.load_workbook(path, data_only=False)
 
 
 def check_formatting_conventions(
@@ -672,61 +1017,54 @@ def check_formatting_conventions(
       INDIRECT/named ranges.
     - External workbook detection only checks for "[workbook]" syntax.
     """
-    import openpyxl
-
     try:
-        wb = openpyxl.load_workbook(xlsx_path, data_only=False)
+        stat = os.stat(xlsx_path)
+        wb = _load_formula_workbook(str(xlsx_path), stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         return False, [f"Failed to open Excel file: {e}"]
 
     try:
-        try:
-            ws = wb[sheet] if sheet else wb.active
-        except KeyError:
-            return False, [f"Sheet '{sheet}' not found"]
+        ws = wb[sheet] if sheet else wb.active
+    except KeyError:
+        return False, [f"Sheet '{sheet}' not found"]
 
-        if ws is None:
-            return False, ["No active sheet found"]
+    if ws is None:
+        return False, ["No active sheet found"]
 
-        violations: list[str] = []
+    violations: list[str] = []
 
-        def check_cell(cell):
-            val = cell.value
-            font = cell.font
+    def check_cell(cell):
+        val = cell.value
+        font = cell.font
 
-            if val is None:
-                return
+        if val is None:
+            return
 
-            is_formula = isinstance(val, str) and val.startswith("=")
+        is_formula = isinstance(val, str) and val.startswith("=")
 
-            if is_formula:
-                if _has_external_workbook_ref(val) and not _is_red(font):
-                    violations.append(
-                        f"{cell.coordinate}: external workbook ref should be red"
-                    )
-                elif _has_cross_sheet_ref(val) and not _is_green(font):
-                    violations.append(
-                        f"{cell.coordinate}: cross-sheet ref should be green"
-                    )
-            else:
-                if isinstance(val, (int, float)) and not _is_blue(font):
-                    violations.append(
-                        f"{cell.coordinate}: hardcoded number should be blue"
-                    )
-
-        if cells:
-            for cell_ref in cells:
-                if ":" in cell_ref:
-                    for row in ws[cell_ref]:
-                        for cell in row if hasattr(row, "__iter__") else [row]:
-                            check_cell(cell)
-                else:
-                    check_cell(ws[cell_ref])
+        if is_formula:
+            ref_kind = _classify_formula_ref(val)
+            if ref_kind == "external" and not _is_red(font):
+                violations.append(
+                    f"{cell.coordinate}: external workbook ref should be red"
+                )
+            elif ref_kind == "cross_sheet" and not _is_green(font):
+                violations.append(f"{cell.coordinate}: cross-sheet ref should be green")
         else:
-            for row in ws.iter_rows():
-                for cell in row:
-                    check_cell(cell)
+            if isinstance(val, (int, float)) and not _is_blue(font):
+                violations.append(f"{cell.coordinate}: hardcoded number should be blue")
+
+    if cells:
+        for cell_ref in cells:
+            if ":" in cell_ref:
+                for row in ws[cell_ref]:
+                    for cell in row if hasattr(row, "__iter__") else [row]:
+                        check_cell(cell)
+            else:
+                check_cell(ws[cell_ref])
+    else:
+        for row in ws.iter_rows():
+            for cell in row:
+                check_cell(cell)
 
-        return len(violations) == 0, violations
-    finally:
-        wb.close()
+    return len(violations) == 0, violations
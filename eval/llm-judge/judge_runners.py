@@ -1,21 +1,71 @@
 """Judge runners for LLM-as-judge scoring."""
 
+import atexit
+import hashlib
 import os
 import sys
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, Protocol, cast
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from helpers import retry_on_rate_limit
-from runners.base import categorize_input_files
+from runners.base import categorize_input_files, shared_client
 
 JudgeProvider = Literal["anthropic", "azure-v2"]
 
 DEFAULT_ANTHROPIC_MODEL = "claude-sonnet-4-5"
 DEFAULT_AZURE_MODEL = "gpt-5.2-chat"
 
+# Files API uploads reused across judge calls, keyed by
+# (client id, file name, sha256 of contents) -> (client, file_id), oldest
+# first. A task's inputs are uploaded once rather than per call; the name is
+# part of the key because the container exposes the file under its upload
+# name. At most MAX_CACHED_JUDGE_UPLOADS stay stored between calls: the oldest
+# are deleted once a judge request has finished with them, score.py clears the
+# rest after each run, and atexit catches anything left on a normal exit.
+MAX_CACHED_JUDGE_UPLOADS = 16
+_judge_uploads: OrderedDict[tuple[int, str, str], tuple[Any, str]] = OrderedDict()
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    """sha256 of a file's contents, recomputed only when size or mtime change.
+
+    Hashed in 1 MiB chunks so large workbooks and PDFs are never held in
+    memory just to be fingerprinted.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _delete_upload(client: Any, file_id: str) -> None:
+    try:
+        client.beta.files.delete(file_id)
+    except Exception as e:
+        print(f"  Warning: Failed to delete file {file_id}: {e}")
+
+
+def _evict_judge_uploads() -> None:
+    """Delete the oldest cached uploads beyond MAX_CACHED_JUDGE_UPLOADS."""
+    while len(_judge_uploads) > MAX_CACHED_JUDGE_UPLOADS:
+        _, (client, file_id) = _judge_uploads.popitem(last=False)
+        _delete_upload(client, file_id)
+
+
+@atexit.register
+def delete_judge_uploads() -> None:
+    """Delete every cached judge upload from the Files API."""
+    while _judge_uploads:
+        _, (client, file_id) = _judge_uploads.popitem(last=False)
+        _delete_upload(client, file_id)
+
 
 class JudgeRunner(Protocol):
     """Protocol for judge runners that send prompts with files and return text."""
@@ -42,7 +92,10 @@ class AnthropicJudge:
         if self._client is None:
             import anthropic
 
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            api_key = cast(str, self.api_key)
+            self._client = shared_client(
+                "anthropic", api_key, lambda: anthropic.Anthropic(api_key=api_key)
+            )
         return self._client
 
     # Expected output: raw JSON text containing a top-level "scores" key.
@@ -81,31 +134,39 @@ class AnthropicJudge:
             ],
         )
 
+    def _upload_file(self, path: Path) -> str:
+        """Upload a file once per process, reusing the file_id for identical content."""
+        stat = path.stat()
+        digest = _file_digest(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        key = (id(self.client), path.name, digest)
+        cached = _judge_uploads.get(key)
+        if cached is not None:
+            _judge_uploads.move_to_end(key)
+            return cached[1]
+        with open(path, "rb") as fp:
+            file_id = self.client.beta.files.upload(file=fp).id
+        _judge_uploads[key] = (self.client, file_id)
+        return file_id
+
     def judge(self, prompt: str, files: list[Path]) -> str:
-        file_objects = []
-        if files:
-            print(f"  Uploading {len(files)} file(s) for judging...")
-            for f in files:
-                with open(f, "rb") as fp:
-                    file_obj = self.client.beta.files.upload(file=fp)
-                    file_objects.append(file_obj)
-
-        content: list[dict[str, Any]] = [
-            {"type": "container_upload", "file_id": fo.id} for fo in file_objects
-        ]
-        content.append({"type": "text", "text": prompt})
-
-        start = time.time()
+        # Evict only after the request: this call's uploads must outlive it
         try:
+            file_ids = []
+            if files:
+                print(f"  Uploading {len(files)} file(s) for judging...")
+                file_ids = [self._upload_file(f) for f in files]
+
+            content: list[dict[str, Any]] = [
+                {"type": "container_upload", "file_id": fid} for fid in file_ids
+            ]
+            content.append({"type": "text", "text": prompt})
+
+            start = time.perf_counter()
             response = self._call_api(content)
         finally:
-            for fo in file_objects:
-                try:
-                    self.client.beta.files.delete(fo.id)
-                except Exception as e:
-                    print(f"  Warning: Failed to delete file {fo.id}: {e}")
+            _evict_judge_uploads()
 
-        print(f"  Judge completed in {(time.time() - start) * 1000:.0f}ms")
+        print(f"  Judge completed in {(time.perf_counter() - start) * 1000:.0f}ms")
         return self._extract_text(response)
 
 
@@ -186,7 +247,7 @@ class AzureJudge:
 
     @retry_on_rate_limit(max_retries=3, initial_wait=60)
     def judge(self, prompt: str, files: list[Path]) -> str:
-        start = time.time()
+        start = time.perf_counter()
         container_id: str | None = None
         vector_store_id: str | None = None
         uploaded_file_ids: list[str] = []
@@ -224,8 +285,7 @@ class AzureJudge:
                 create_params["tools"] = tools
 
             response = self.openai.responses.create(**create_params)
-            # raw_text parsed by _parse_response() in llm-judge/llm_judge.py
-            raw_text = ""
+            text_parts: list[str] = []
             output = getattr(response, "output", None)
             if output:
                 for item in output:
@@ -235,9 +295,11 @@ class AzureJudge:
                             for c in content:
                                 c_type = getattr(c, "type", None)
                                 if c_type in {"output_text", "text"}:
-                                    raw_text += getattr(c, "text", "")
+                                    text_parts.append(getattr(c, "text", ""))
+            # raw_text parsed by _parse_response() in llm-judge/llm_judge.py
+            raw_text = "".join(text_parts)
 
-            print(f"  Judge completed in {(time.time() - start) * 1000:.0f}ms")
+            print(f"  Judge completed in {(time.perf_counter() - start) * 1000:.0f}ms")
             return raw_text
 
         finally:
@@ -2,6 +2,7 @@
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from helpers import Rubric, extract_json
 from judge_runners import JudgeProvider, JudgeRunner, get_judge_runner
 
+PROMPT_TEMPLATE_PATH = Path(__file__).parent / "llm_judge.md"
+
+
+@lru_cache(maxsize=1)
+def _load_prompt_template() -> str:
+    """Read the judge prompt template once per process."""
+    return PROMPT_TEMPLATE_PATH.read_text()
+
 
 class LLMJudge:
     """LLM-as-judge scorer using configurable provider."""
@@ -33,8 +42,7 @@ class LLMJudge:
         file_names: list[str],
         task_prompt: str,
     ) -> str:
-        prompt_path = Path(__file__).parent / "llm_judge.md"
-        template = prompt_path.read_text()
+        template = _load_prompt_template()
 
         criteria_text = "\n".join(
             f"- **{cid}** ({spec.get('points', 0)} points): {spec.get('description', '')}"
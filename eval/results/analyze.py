@@ -8,16 +8,23 @@ Usage:
 """
 
 import argparse
+import io
 import json
-from collections import defaultdict
-from dataclasses import dataclass
+import sys
+from collections import Counter
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from helpers import load_task_meta_index, scan_score_files
 from leaderboard import load_config as load_leaderboard_config
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Parsed result for a single task."""
 
@@ -27,17 +34,29 @@ class TaskResult:
     score_percent: float
     criteria: list[dict]
     llm_gated: bool = False
+    credit_tier: str = field(init=False)
+
+    @classmethod
+    def from_score_data(cls, data: dict) -> "TaskResult":
+        """Build from a decoded score file."""
+        return cls(
+            task_id=data["task_id"],
+            points_earned=data.get("points_earned", 0),
+            total_points=data.get("total_points", 100),
+            score_percent=data.get("score_percent", 0),
+            criteria=data.get("criteria", []),
+            llm_gated=data.get("llm_gated", False),
+        )
 
-    @property
-    def credit_tier(self) -> str:
+    def __post_init__(self):
         if self.score_percent >= 90:
-            return "full"
+            self.credit_tier = "full"
         elif self.score_percent >= 50:
-            return "half"
+            self.credit_tier = "half"
         elif self.score_percent > 0:
-            return "partial"
+            self.credit_tier = "partial"
         else:
-            return "fail"
+            self.credit_tier = "fail"
 
 
 def load_run(
@@ -70,28 +89,16 @@ def _load_single_run(
     config = {}
     config_file = responses_dir / "config.json"
     if config_file.exists():
-        with open(config_file) as f:
-            config = json.load(f)
+        config = json.loads(config_file.read_bytes())
 
     config["model"] = model
     config["run_id"] = run_id
 
     results = []
-    for score_file in sorted(scores_dir.glob("*.json")):
-        if score_file.name == "summary.json":
-            continue
-        with open(score_file) as f:
-            data = json.load(f)
-            results.append(
-                TaskResult(
-                    task_id=data["task_id"],
-                    points_earned=data.get("points_earned", 0),
-                    total_points=data.get("total_points", 100),
-                    score_percent=data.get("score_percent", 0),
-                    criteria=data.get("criteria", []),
-                    llm_gated=data.get("llm_gated", False),
-                )
-            )
+    for entry in sorted(scan_score_files(scores_dir), key=lambda e: e.name):
+        with open(entry.path, "rb") as f:
+            data = json.loads(f.read())
+        results.append(TaskResult.from_score_data(data))
 
     return config, results
 
@@ -110,32 +117,19 @@ def _load_all_runs_for_model(
 
     scores_by_task: dict[str, dict] = {}
     for run_dir in run_dirs:
-        for score_file in run_dir.glob("*.json"):
-            if score_file.name == "summary.json":
-                continue
-            with open(score_file) as f:
-                data = json.load(f)
-                task_id = data.get("task_id")
-                if task_id:
-                    scores_by_task[task_id] = data
+        for entry in scan_score_files(run_dir):
+            with open(entry.path, "rb") as f:
+                data = json.loads(f.read())
+            task_id = data.get("task_id")
+            if task_id:
+                scores_by_task[task_id] = data
 
     config = {
         "model": model,
         "run_id": f"(aggregated from {len(run_dirs)} runs)",
     }
 
-    results = []
-    for data in scores_by_task.values():
-        results.append(
-            TaskResult(
-                task_id=data["task_id"],
-                points_earned=data.get("points_earned", 0),
-                total_points=data.get("total_points", 100),
-                score_percent=data.get("score_percent", 0),
-                criteria=data.get("criteria", []),
-                llm_gated=data.get("llm_gated", False),
-            )
-        )
+    results = [TaskResult.from_score_data(data) for data in scores_by_task.values()]
 
     return config, sorted(results, key=lambda r: r.task_id)
 
@@ -145,10 +139,11 @@ DIFFICULTY_MAP = {"e": "easy", "m": "medium", "h": "hard"}
 
 def get_difficulty(task_id: str) -> str:
     """Get difficulty tier from task ID prefix."""
-    prefix = task_id.split("-")[0]
+    prefix = task_id.partition("-")[0]
     return DIFFICULTY_MAP.get(prefix, "unknown")
 
 
+@cache
 def get_provider(model: str) -> str:
     """Infer provider from model name."""
     model_lower = model.lower()
@@ -161,22 +156,16 @@ def get_provider(model: str) -> str:
     return "unknown"
 
 
-def get_task_category(task_id: str) -> str:
-    tasks_dir = Path(__file__).parent.parent / "tasks"
-    task_dir = tasks_dir / task_id
-    meta_file = task_dir / "meta.yaml"
-
-    if meta_file.exists():
-        import yaml
-
-        with open(meta_file) as f:
-            meta = yaml.safe_load(f)
-            if isinstance(meta, dict):
-                category = meta.get("task", {}).get("category", "unknown")
-                if isinstance(category, list):
-                    return category[0] if category else "unknown"
-                return category
-    return "unknown"
+def load_task_categories(tasks_dir: Path) -> dict[str, str]:
+    """Map task_id -> primary category from the cached task metadata."""
+    categories: dict[str, str] = {}
+    for task_id, meta in load_task_meta_index(tasks_dir).items():
+        category = meta.get("task", {}).get("category", "unknown")
+        if isinstance(category, list):
+            category = category[0] if category else "unknown"
+        categories[task_id] = category
+
+    return categories
 
 
 def print_header(title: str):
@@ -232,16 +221,62 @@ def analyze_run(config: dict, results: list[TaskResult], total_tasks: int):
     # ══════════════════════════════════════════════════════════════════
     print_header("SCORE SUMMARY")
 
-    # Group by difficulty
+    tasks_dir = Path(__file__).parent.parent / "tasks"
+    task_categories = load_task_categories(tasks_dir)
+
+    # Single pass over results (and their criteria) for every aggregate below
     by_difficulty: dict[str, list[TaskResult]] = {"easy": [], "medium": [], "hard": []}
+    tier_buckets: dict[str, list[TaskResult]] = {
+        "full": [],
+        "half": [],
+        "partial": [],
+        "fail": [],
+    }
+    zero_scores: list[TaskResult] = []
+    llm_skipped: list[str] = []
+    json_failures: list[TaskResult] = []
+    gated: list[TaskResult] = []
+    total_by_type: Counter[str] = Counter()
+    passed_by_type: Counter[str] = Counter()
+    total_by_cat: Counter[str] = Counter()
+    passed_by_cat: Counter[str] = Counter()
+
     for r in results:
         diff = get_difficulty(r.task_id)
         if diff in by_difficulty:
             by_difficulty[diff].append(r)
 
+        tier = r.credit_tier
+        tier_buckets[tier].append(r)
+
+        if r.score_percent == 0:
+            zero_scores.append(r)
+        if r.llm_gated:
+            gated.append(r)
+
+        cat = task_categories.get(r.task_id, "unknown")
+        total_by_cat[cat] += 1
+        if tier in ("full", "half"):
+            passed_by_cat[cat] += 1
+
+        judge_skipped = False
+        json_failed = False
+        for c in r.criteria:
+            ctype = c.get("type", "unknown")
+            total_by_type[ctype] += 1
+            if c.get("passed"):
+                passed_by_type[ctype] += 1
+            if ctype == "llm_judge" and "not scored" in c.get("details", "").lower():
+                judge_skipped = True
+            if c.get("id") == "json_parse":
+                json_failed = True
+        if judge_skipped:
+            llm_skipped.append(r.task_id)
+        if json_failed:
+            json_failures.append(r)
+
     # Count task totals per difficulty
     task_counts = {"easy": 0, "medium": 0, "hard": 0}
-    tasks_dir = Path(__file__).parent.parent / "tasks"
     for task_path in tasks_dir.iterdir():
         if not task_path.is_dir() or task_path.name.startswith("_"):
             continue
@@ -283,10 +318,10 @@ def analyze_run(config: dict, results: list[TaskResult], total_tasks: int):
             print(f"  {diff.capitalize():<9} -     (0 tasks attempted)")
 
     # Credit counts
-    full = sum(1 for r in results if r.credit_tier == "full")
-    half = sum(1 for r in results if r.credit_tier == "half")
-    partial = sum(1 for r in results if r.credit_tier == "partial")
-    fail = sum(1 for r in results if r.credit_tier == "fail")
+    full = len(tier_buckets["full"])
+    half = len(tier_buckets["half"])
+    partial = len(tier_buckets["partial"])
+    fail = len(tier_buckets["fail"])
 
     print(f"\n  Full: {full} | Half: {half} | Partial: {partial} | Fail: {fail}")
 
@@ -298,22 +333,12 @@ def analyze_run(config: dict, results: list[TaskResult], total_tasks: int):
     warnings = []
 
     # Check for 0% scores
-    zero_scores = [r for r in results if r.score_percent == 0]
     if zero_scores:
         warnings.append(
             f"⚠ {len(zero_scores)} tasks scored 0% - check rubrics or model output"
         )
 
     # Check for LLM judge issues
-    llm_skipped = []
-    for r in results:
-        for c in r.criteria:
-            if (
-                c.get("type") == "llm_judge"
-                and "not scored" in c.get("details", "").lower()
-            ):
-                llm_skipped.append(r.task_id)
-                break
     if llm_skipped:
         task_list = ", ".join(llm_skipped[:5])
         if len(llm_skipped) > 5:
@@ -321,14 +346,10 @@ def analyze_run(config: dict, results: list[TaskResult], total_tasks: int):
         warnings.append(f"⚠ LLM judge skipped on {task_list}")
 
     # Check for JSON parse failures
-    json_failures = [
-        r for r in results if any(c.get("id") == "json_parse" for c in r.criteria)
-    ]
     if json_failures:
         warnings.append(f"⚠ {len(json_failures)} tasks failed JSON parsing")
 
     # Check for gated LLM
-    gated = [r for r in results if r.llm_gated]
     if gated:
         warnings.append(
             f"⚠ {len(gated)} tasks had LLM evaluation gated (programmatic prereq failed)"
@@ -345,10 +366,10 @@ def analyze_run(config: dict, results: list[TaskResult], total_tasks: int):
     # ══════════════════════════════════════════════════════════════════
 
     tiers = [
-        ("FULL CREDIT", "full", [r for r in results if r.credit_tier == "full"]),
-        ("HALF CREDIT", "half", [r for r in results if r.credit_tier == "half"]),
-        ("PARTIAL FAIL", "partial", [r for r in results if r.credit_tier == "partial"]),
-        ("FULL FAIL", "fail", [r for r in results if r.credit_tier == "fail"]),
+        ("FULL CREDIT", "full", tier_buckets["full"]),
+        ("HALF CREDIT", "half", tier_buckets["half"]),
+        ("PARTIAL FAIL", "partial", tier_buckets["partial"]),
+        ("FULL FAIL", "fail", tier_buckets["fail"]),
     ]
 
     for title, tier, tier_results in tiers:
@@ -393,33 +414,18 @@ def analyze_run(config: dict, results: list[TaskResult], total_tasks: int):
 
     # By criteria type
     print("\n  By criteria type:")
-    by_type = defaultdict(lambda: {"passed": 0, "total": 0})
-    for r in results:
-        for c in r.criteria:
-            ctype = c.get("type", "unknown")
-            by_type[ctype]["total"] += 1
-            if c.get("passed"):
-                by_type[ctype]["passed"] += 1
-
-    for ctype, counts in sorted(by_type.items()):
-        passed = counts["passed"]
-        total = counts["total"]
+    for ctype in sorted(total_by_type):
+        passed = passed_by_type[ctype]
+        total = total_by_type[ctype]
         pct = (passed / total * 100) if total > 0 else 0
         flag = " ← low" if pct < 30 and total >= 3 else ""
         print(f"    {ctype}: {passed}/{total} passed ({pct:.0f}%){flag}")
 
     # By task category
     print("\n  By task category:")
-    by_cat = defaultdict(lambda: {"passed": 0, "total": 0})
-    for r in results:
-        cat = get_task_category(r.task_id)
-        by_cat[cat]["total"] += 1
-        if r.credit_tier in ["full", "half"]:
-            by_cat[cat]["passed"] += 1
-
-    for cat, counts in sorted(by_cat.items()):
-        passed = counts["passed"]
-        total = counts["total"]
+    for cat in sorted(total_by_cat):
+        passed = passed_by_cat[cat]
+        total = total_by_cat[cat]
         pct = (passed / total * 100) if total > 0 else 0
         flag = " ← low" if pct < 30 and total >= 2 else ""
         print(f"    {cat}: {passed}/{total} passed ({pct:.0f}%){flag}")
@@ -439,7 +445,7 @@ def compare_runs(
     r1_map = {r.task_id: r for r in results1}
     r2_map = {r.task_id: r for r in results2}
 
-    all_tasks = sorted(set(r1_map.keys()) | set(r2_map.keys()))
+    all_tasks = sorted(r1_map.keys() | r2_map.keys())
 
     print(f"\n  {'Task':<10} {'Run 1':>10} {'Run 2':>10} {'Delta':>10}")
     print("  " + "-" * 45)
@@ -486,13 +492,19 @@ def main():
     # Load primary run
     config, results = load_run(args.run_path)
 
-    # Analyze
-    analyze_run(config, results, total_tasks)
-
-    # Compare if requested
-    if args.compare:
-        config2, results2 = load_run(args.compare)
-        compare_runs(config, results, config2, results2)
+    # Buffer the report and write it to stdout in one go
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            # Analyze
+            analyze_run(config, results, total_tasks)
+
+            # Compare if requested
+            if args.compare:
+                config2, results2 = load_run(args.compare)
+                compare_runs(config, results, config2, results2)
+    finally:
+        sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
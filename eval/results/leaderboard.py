@@ -8,11 +8,14 @@ Configuration (weights, models filter) is read from configs/leaderboard_config.y
 """
 
 import json
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-import yaml
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from helpers import load_yaml, scan_score_files
 
 
 @dataclass
@@ -49,8 +52,7 @@ def load_config(config_path: Path | None = None) -> dict:
         )
 
     if config_path.exists():
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        return load_yaml(config_path.read_bytes())
 
     # Default config
     return {
@@ -59,10 +61,13 @@ def load_config(config_path: Path | None = None) -> dict:
     }
 
 
+DIFFICULTY_MAP = {"e": "easy", "m": "medium", "h": "hard"}
+
+
 def get_difficulty(task_id: str) -> str:
     """Extract difficulty from task ID (e-001 -> easy)."""
-    prefix = task_id.split("-")[0]
-    return {"e": "easy", "m": "medium", "h": "hard"}.get(prefix, "unknown")
+    prefix = task_id.partition("-")[0]
+    return DIFFICULTY_MAP.get(prefix, "unknown")
 
 
 def count_tasks_by_difficulty(tasks_dir: Path | None = None) -> dict[str, int]:
@@ -94,11 +99,9 @@ def find_all_runs(model_dir: Path) -> list[Path]:
 def load_run_scores(run_dir: Path) -> list[dict]:
     """Load all score files from a run directory."""
     scores = []
-    for score_file in run_dir.glob("*.json"):
-        if score_file.name == "summary.json":
-            continue
-        with open(score_file) as f:
-            scores.append(json.load(f))
+    for entry in scan_score_files(run_dir):
+        with open(entry.path, "rb") as f:
+            scores.append(json.loads(f.read()))
     return scores
 
 
@@ -403,8 +406,7 @@ def export_json(
     }
 
     resolved_output_file = output_file or (output_path / "leaderboard.json")
-    with open(resolved_output_file, "w") as f:
-        json.dump(data, f, indent=2)
+    resolved_output_file.write_text(json.dumps(data, indent=2))
 
     print(f"Exported to: {resolved_output_file}")
 
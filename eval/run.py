@@ -16,8 +16,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
-import yaml
-
 from helpers import (
     Provider,
     Task,
@@ -25,6 +23,7 @@ from helpers import (
     create_run_directory,
     get_runner,
     load_tasks,
+    load_yaml,
 )
 from runners import (
     AnthropicRunner,
@@ -63,8 +62,7 @@ class TaskResult(TypedDict, total=False):
 
 def load_config(config_path: Path) -> dict[str, Any]:
     """Load configuration from YAML file."""
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+    return load_yaml(config_path.read_bytes()) or {}
 
 
 def _select_input_files(task: Task) -> list[Path]:
@@ -242,6 +240,10 @@ async def run_tasks_parallel(
 
     async def safe_run(task: Task) -> TaskResult:
         try:
+            # Build the lazy client here, on the event loop thread, so worker
+            # threads never race to import the SDK and create it; setup
+            # errors are still reported per task below
+            _ = runner.client
             return await run_task_async(task, runner, run_dir, semaphore)
         except Exception as e:
             input_files = _select_input_files(task)
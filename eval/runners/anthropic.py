@@ -7,7 +7,15 @@ from typing import Any, cast
 
 from helpers import Task, extract_json, retry_on_rate_limit
 
-from .base import LLMResponse, OutputFile, is_content_filter_error, read_file_content
+from .base import (
+    LLMResponse,
+    OutputFile,
+    delete_in_background,
+    is_content_filter_error,
+    read_file_content,
+    shared_client,
+    upload_concurrently,
+)
 
 
 class AnthropicRunner:
@@ -27,7 +35,10 @@ class AnthropicRunner:
         if self._client is None:
             import anthropic
 
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            api_key = cast(str, self.api_key)
+            self._client = shared_client(
+                "anthropic", api_key, lambda: anthropic.Anthropic(api_key=api_key)
+            )
         return self._client
 
     @retry_on_rate_limit(max_retries=3, initial_wait=60)
@@ -41,7 +52,7 @@ class AnthropicRunner:
 
     def _run_text_only(self, task: Task) -> LLMResponse:
         """Run task with text prompt only (no Excel file)."""
-        start = time.time()
+        start = time.perf_counter()
         try:
             response = self.client.messages.create(
                 model=self.model,
@@ -50,7 +61,7 @@ class AnthropicRunner:
                 messages=[{"role": "user", "content": task.prompt}],
             )
         except Exception as e:
-            latency_ms = (time.time() - start) * 1000
+            latency_ms = (time.perf_counter() - start) * 1000
             if is_content_filter_error(str(e)):
                 print("  BLOCKED: Content filter triggered")
                 return LLMResponse(
@@ -65,7 +76,7 @@ class AnthropicRunner:
                 )
             raise
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
 
         first_block = response.content[0]
         raw_text: str = getattr(first_block, "text", "")
@@ -88,19 +99,21 @@ class AnthropicRunner:
 
     def _run_with_files(self, task: Task, input_files: list[Path]) -> LLMResponse:
         """Run with file upload - uploads files via Files API and uses code execution."""
-        file_ids = []
-        for input_file in input_files:
+        client = self.client
+
+        def upload(input_file: Path) -> str:
             print(f"Uploading {input_file.name} to Files API...")
             with open(input_file, "rb") as f:
-                file_obj = self.client.beta.files.upload(file=f)
-                file_ids.append(file_obj.id)
+                return client.beta.files.upload(file=f).id
+
+        file_ids = upload_concurrently(upload, input_files)
 
         content: list[Any] = []
         for file_id in file_ids:
             content.append({"type": "container_upload", "file_id": file_id})
         content.append({"type": "text", "text": task.prompt})
 
-        start = time.time()
+        start = time.perf_counter()
         content_filter_triggered = False
         messages: list[Any] = [{"role": "user", "content": content}]
         all_content_blocks: list[Any] = []
@@ -154,13 +167,9 @@ class AnthropicRunner:
                 )
 
         finally:
-            for file_id in file_ids:
-                try:
-                    self.client.beta.files.delete(file_id)
-                except Exception as e:
-                    print(f"  Warning: Failed to delete file {file_id}: {e}")
+            delete_in_background(self.client.beta.files.delete, file_ids)
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
 
         if content_filter_triggered:
             return LLMResponse(
@@ -174,7 +183,7 @@ class AnthropicRunner:
                 output_files=None,
             )
 
-        raw_text = ""
+        text_parts: list[str] = []
         output_files: list[OutputFile] = []
         extracted_file_ids: list[str] = []
 
@@ -184,7 +193,7 @@ class AnthropicRunner:
             if block_type == "text":
                 block_text = getattr(block, "text", None)
                 if block_text:
-                    raw_text += block_text + "\n"
+                    text_parts.append(block_text)
 
             elif block_type == "bash_code_execution_tool_result":
                 block_content = getattr(block, "content", None)
@@ -193,7 +202,7 @@ class AnthropicRunner:
                     if content_type == "bash_code_execution_result":
                         stdout = getattr(block_content, "stdout", None)
                         if stdout:
-                            raw_text += stdout + "\n"
+                            text_parts.append(stdout)
                         inner_content = getattr(block_content, "content", []) or []
                         for item in inner_content:
                             file_id = getattr(item, "file_id", None)
@@ -205,7 +214,7 @@ class AnthropicRunner:
                 if block_content:
                     content_text = getattr(block_content, "content", None)
                     if content_text and isinstance(content_text, str):
-                        raw_text += content_text + "\n"
+                        text_parts.append(content_text)
 
             elif block_type == "code_execution_result":
                 container_id = getattr(block, "container_id", None) or container_id
@@ -215,9 +224,9 @@ class AnthropicRunner:
                         stdout = getattr(item, "stdout", None)
                         item_text = getattr(item, "text", None)
                         if stdout:
-                            raw_text += stdout + "\n"
+                            text_parts.append(stdout)
                         elif item_text:
-                            raw_text += item_text + "\n"
+                            text_parts.append(item_text)
 
         for file_id in extracted_file_ids:
             try:
@@ -256,6 +265,7 @@ class AnthropicRunner:
             except Exception as e:
                 print(f"  Warning: Failed to retrieve container files: {e}")
 
+        raw_text = "".join(f"{part}\n" for part in text_parts)
         parsed_json = extract_json(raw_text)
 
         if final_stop_reason == "max_tokens":
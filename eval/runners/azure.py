@@ -312,7 +312,7 @@ class AzureAgentRunner:
             ToolResources,
         )
 
-        start = time.time()
+        start = time.perf_counter()
         files = input_files or []
 
         code_files, search_files = categorize_input_files(files)
@@ -398,7 +398,7 @@ class AzureAgentRunner:
             input_tokens = getattr(usage, "prompt_tokens", 0) if usage else 0
             output_tokens = getattr(usage, "completion_tokens", 0) if usage else 0
 
-            latency_ms = (time.time() - start) * 1000
+            latency_ms = (time.perf_counter() - start) * 1000
 
             raw_text = extract_text_from_messages(messages)
 
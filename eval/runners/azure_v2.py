@@ -249,7 +249,7 @@ class AzureAgentRunnerV2:
 
     @retry_on_rate_limit(max_retries=3, initial_wait=60)
     def run(self, task: Task, input_files: list[Path] | None = None) -> LLMResponse:
-        start = time.time()
+        start = time.perf_counter()
         files = input_files or []
 
         code_files, search_files = categorize_input_files(files)
@@ -365,9 +365,9 @@ class AzureAgentRunnerV2:
                     )
                     new_response_after_loop = True
 
-            latency_ms = (time.time() - start) * 1000
+            latency_ms = (time.perf_counter() - start) * 1000
 
-            raw_text = ""
+            text_parts: list[str] = []
             output = getattr(response, "output", None)
             if output:
                 for item in output:
@@ -377,10 +377,9 @@ class AzureAgentRunnerV2:
                         if content:
                             for c in content:
                                 c_type = getattr(c, "type", None)
-                                if c_type == "output_text":
-                                    raw_text += getattr(c, "text", "")
-                                elif c_type == "text":
-                                    raw_text += getattr(c, "text", "")
+                                if c_type in {"output_text", "text"}:
+                                    text_parts.append(getattr(c, "text", ""))
+            raw_text = "".join(text_parts)
 
             usage = getattr(response, "usage", None)
             if use_native_web_search:
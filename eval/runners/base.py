@@ -1,8 +1,24 @@
 """Shared types and utilities for LLM provider runners."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from threading import Lock
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Uploads are independent blocking HTTP calls; cap how many run at once
+MAX_CONCURRENT_UPLOADS = 8
+
+# SDK clients keyed by (provider, api_key); each holds its own connection pool
+_shared_clients: dict[tuple[str, str], Any] = {}
+_shared_clients_lock = Lock()
+
+# Deleting uploaded files does not affect the response, so it runs off the task's
+# critical path; the pool's workers are joined (finishing queued deletes) at exit
+_cleanup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ib-cleanup")
 
 
 def is_content_filter_error(error_str: str) -> bool:
@@ -42,7 +58,7 @@ class OutputFile:
     mime_type: str = "application/octet-stream"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Standardized response from any LLM provider."""
 
@@ -82,3 +98,44 @@ def categorize_input_files(
             search_files.append(f)
 
     return code_files, search_files
+
+
+def upload_concurrently(upload: Callable[[Path], T], paths: list[Path]) -> list[T]:
+    """Run upload() for each path on a thread pool, returning results in input order.
+
+    The first failure is re-raised once all uploads have finished.
+    """
+    if len(paths) <= 1:
+        return [upload(p) for p in paths]
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_CONCURRENT_UPLOADS, len(paths))
+    ) as pool:
+        return list(pool.map(upload, paths))
+
+
+def shared_client(provider: str, api_key: str, factory: Callable[[], T]) -> T:
+    """Return the process-wide SDK client for (provider, api_key), creating it once.
+
+    Runners and judges that use the same credentials then share one connection
+    pool instead of each opening (and TLS-handshaking) their own.
+    """
+    key = (provider, api_key)
+    with _shared_clients_lock:
+        if key not in _shared_clients:
+            _shared_clients[key] = factory()
+        return _shared_clients[key]
+
+
+def delete_in_background(
+    delete: Callable[[str], Any], resource_ids: list[str], kind: str = "file"
+) -> None:
+    """Queue delete(id) for each id on the cleanup pool, warning on failure."""
+
+    def _delete(resource_id: str) -> None:
+        try:
+            delete(resource_id)
+        except Exception as e:
+            print(f"  Warning: Failed to delete {kind} {resource_id}: {e}")
+
+    for resource_id in resource_ids:
+        _cleanup_pool.submit(_delete, resource_id)
@@ -3,10 +3,17 @@
 import os
 import time
 from pathlib import Path
+from typing import cast
 
 from helpers import Task, extract_json, retry_on_rate_limit
 
-from .base import LLMResponse, OutputFile, is_content_filter_error
+from .base import (
+    LLMResponse,
+    OutputFile,
+    delete_in_background,
+    is_content_filter_error,
+    shared_client,
+)
 
 
 class GeminiRunner:
@@ -30,7 +37,10 @@ class GeminiRunner:
         if self._client is None:
             from google import genai
 
-            self._client = genai.Client(api_key=self.api_key)
+            api_key = cast(str, self.api_key)
+            self._client = shared_client(
+                "gemini", api_key, lambda: genai.Client(api_key=api_key)
+            )
         return self._client
 
     def _upload_file(self, path: Path) -> object:
@@ -43,7 +53,7 @@ class GeminiRunner:
         """Execute a task using Gemini with file upload and code execution."""
         from google.genai import types
 
-        start = time.time()
+        start = time.perf_counter()
 
         uploaded_files = []
         files_to_upload = input_files or []
@@ -76,13 +86,13 @@ class GeminiRunner:
             else:
                 raise
         finally:
-            for uploaded_file in uploaded_files:
-                try:
-                    self.client.files.delete(name=uploaded_file.name)
-                except Exception as e:
-                    print(f"  Warning: Failed to delete file {uploaded_file.name}: {e}")
+            client = self.client
+            delete_in_background(
+                lambda name: client.files.delete(name=name),
+                [uploaded_file.name for uploaded_file in uploaded_files],
+            )
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
 
         if content_filter_triggered:
             return LLMResponse(
@@ -116,7 +126,7 @@ class GeminiRunner:
                     output_files=None,
                 )
 
-        response_text = ""
+        text_parts: list[str] = []
         output_files = []
         file_counter = 0
 
@@ -125,7 +135,7 @@ class GeminiRunner:
         if parts:
             for part in parts:
                 if hasattr(part, "text") and part.text is not None:
-                    response_text += part.text + "\n"
+                    text_parts.append(part.text)
                 if hasattr(part, "inline_data") and part.inline_data:
                     file_counter += 1
                     mime_type = getattr(
@@ -157,6 +167,7 @@ class GeminiRunner:
                 if stop_reason == "max_tokens":
                     print("  WARNING: Output truncated (hit max_tokens limit)")
 
+        response_text = "".join(f"{part}\n" for part in text_parts)
         parsed_json = extract_json(response_text)
 
         return LLMResponse(
@@ -7,7 +7,15 @@ from typing import cast
 
 from helpers import Task, extract_json, retry_on_rate_limit
 
-from .base import LLMResponse, OutputFile, is_content_filter_error, read_file_content
+from .base import (
+    LLMResponse,
+    OutputFile,
+    delete_in_background,
+    is_content_filter_error,
+    read_file_content,
+    shared_client,
+    upload_concurrently,
+)
 
 
 class OpenAIRunner:
@@ -27,7 +35,10 @@ class OpenAIRunner:
         if self._client is None:
             import openai
 
-            self._client = openai.OpenAI(api_key=self.api_key)
+            api_key = cast(str, self.api_key)
+            self._client = shared_client(
+                "openai", api_key, lambda: openai.OpenAI(api_key=api_key)
+            )
         return self._client
 
     def _upload_file(self, path: Path) -> str:
@@ -62,7 +73,7 @@ class OpenAIRunner:
         """Execute a task using Responses API with tools."""
         import base64
 
-        start = time.time()
+        start = time.perf_counter()
         files = input_files or []
         tools: list[dict] = [{"type": "web_search"}]
         vector_store_id = None
@@ -74,13 +85,19 @@ class OpenAIRunner:
             f for f in files if f.suffix.lower() in [".png", ".jpg", ".jpeg"]
         ]
 
+        # Upload PDFs and code-interpreter files together in one concurrent batch
         if pdf_files:
             print(f"Uploading {len(pdf_files)} PDF(s) for file search...")
-            pdf_file_ids = []
-            for pdf in pdf_files:
-                fid = self._upload_file(pdf)
-                pdf_file_ids.append(fid)
-                uploaded_file_ids.append(fid)
+        if code_files:
+            print(f"Uploading {len(code_files)} file(s) for code interpreter...")
+        if pdf_files or code_files:
+            uploaded_file_ids = upload_concurrently(
+                self._upload_file, pdf_files + code_files
+            )
+        pdf_file_ids = uploaded_file_ids[: len(pdf_files)]
+        code_file_ids = uploaded_file_ids[len(pdf_files) :]
+
+        if pdf_files:
             vector_store_id = self._create_vector_store(pdf_file_ids)
             tools.append(
                 {
@@ -89,13 +106,7 @@ class OpenAIRunner:
                 }
             )
 
-        code_file_ids = []
         if code_files:
-            print(f"Uploading {len(code_files)} file(s) for code interpreter...")
-            for cf in code_files:
-                fid = self._upload_file(cf)
-                code_file_ids.append(fid)
-                uploaded_file_ids.append(fid)
             tools.append(
                 {
                     "type": "code_interpreter",
@@ -149,18 +160,13 @@ class OpenAIRunner:
                 raise
         finally:
             if vector_store_id:
-                try:
-                    self.client.vector_stores.delete(vector_store_id)
-                except Exception as e:
-                    print(f"  Warning: Failed to delete vector store: {e}")
-
-            for fid in uploaded_file_ids:
-                try:
-                    self.client.files.delete(fid)
-                except Exception as e:
-                    print(f"  Warning: Failed to delete file {fid}: {e}")
-
-        latency_ms = (time.time() - start) * 1000
+                delete_in_background(
+                    self.client.vector_stores.delete, [vector_store_id], "vector store"
+                )
+            if uploaded_file_ids:
+                delete_in_background(self.client.files.delete, uploaded_file_ids)
+
+        latency_ms = (time.perf_counter() - start) * 1000
 
         if content_filter_triggered:
             return LLMResponse(
@@ -88,7 +88,7 @@ class VertexAIRunner:
         """
         from google.genai import types
 
-        start = time.time()
+        start = time.perf_counter()
 
         uploaded_files = []
         files_to_upload = input_files or []
@@ -130,7 +130,7 @@ class VertexAIRunner:
             for uploaded_file in uploaded_files:
                 self._delete_file(uploaded_file)
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
 
         if content_filter_triggered:
             return LLMResponse(
@@ -169,7 +169,7 @@ class VertexAIRunner:
                     output_files=None,
                 )
 
-        response_text = ""
+        text_parts: list[str] = []
         output_files = []
         file_counter = 0
 
@@ -177,7 +177,7 @@ class VertexAIRunner:
         parts = list(content.parts) if content and content.parts else []
         for part in parts:
             if hasattr(part, "text") and part.text is not None:
-                response_text += part.text + "\n"
+                text_parts.append(part.text)
 
             if hasattr(part, "executable_code") and part.executable_code:
                 code = getattr(part.executable_code, "code", None)
@@ -187,7 +187,7 @@ class VertexAIRunner:
             if hasattr(part, "code_execution_result") and part.code_execution_result:
                 result = getattr(part.code_execution_result, "output", None)
                 if result:
-                    response_text += result + "\n"
+                    text_parts.append(result)
 
             if hasattr(part, "inline_data") and part.inline_data:
                 file_counter += 1
@@ -222,6 +222,7 @@ class VertexAIRunner:
                 if stop_reason == "max_tokens":
                     print("  WARNING: Output truncated (hit max_tokens limit)")
 
+        response_text = "".join(f"{part}\n" for part in text_parts)
         parsed_json = extract_json(response_text)
 
         return LLMResponse(
@@ -22,6 +22,7 @@ import argparse
 import json
 import re
 import sys
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent / "llm-judge"))
 
 from helpers import (
     JudgeParseError,
+    ResponseSummary,
     Rubric,
     RubricCriterion,
     Task,
@@ -38,9 +40,11 @@ from helpers import (
     check_cell_value,
     check_formatting_conventions,
     extract_task_section,
-    get_rubric_hash,
     load_tasks,
+    load_values_workbook,
+    summarize_response,
 )
+from judge_runners import delete_judge_uploads
 from llm_judge import LLMJudge
 
 EvalType = Literal["programmatic", "llm", "human", "hybrid"]
@@ -76,6 +80,7 @@ class ScoreData(TypedDict, total=False):
     llm_gated: bool
     judge: str
     criteria: list[CriterionData]
+    response_summary: ResponseSummary
 
 
 # schema for summary reporting
@@ -154,6 +159,8 @@ def _evaluate_excel_cell(
     criterion: RubricCriterion,
     output_files: list[str] | None,
     run_dir: Path | None,
+    workbooks: dict[Path, Any] | None = None,
+    open_workbooks: ExitStack | None = None,
 ) -> tuple[bool, Any, str, dict[str, Any]]:
     """
     Evaluate excel_cell_value criterion.
@@ -161,6 +168,9 @@ def _evaluate_excel_cell(
     :param criterion: Criterion spec with cell, expected, tolerance, sheet
     :param output_files: List of output file names
     :param run_dir: Directory containing output files
+    :param workbooks: Open workbooks by path, shared across a task's criteria
+        (None on load failure, so check_cell_value reports the error)
+    :param open_workbooks: Stack that closes the workbooks opened here
     :returns: (passed, actual_value, details, expected_dict)
     """
     cell = criterion.get("cell", "")
@@ -180,8 +190,19 @@ def _evaluate_excel_cell(
     if not xlsx_path.exists():
         return False, None, f"Output file not found: {xlsx_path}", expected
 
+    wb = None
+    if workbooks is not None and open_workbooks is not None:
+        if xlsx_path not in workbooks:
+            try:
+                wb = load_values_workbook(xlsx_path)
+                open_workbooks.callback(wb.close)
+            except Exception:
+                wb = None
+            workbooks[xlsx_path] = wb
+        wb = workbooks[xlsx_path]
+
     passed, actual, details = check_cell_value(
-        xlsx_path, cell, expected_val, sheet=sheet, tolerance=tolerance
+        xlsx_path, cell, expected_val, sheet=sheet, tolerance=tolerance, wb=wb
     )
     return passed, actual, details, expected
 
@@ -235,8 +256,24 @@ def _evaluate_programmatic_criteria(
     :param run_dir: Directory containing output files
     :returns: (criterion results, gate_failed)
     """
+    # Output workbooks opened for excel_cell_value checks are shared across the
+    # task's criteria and closed together once evaluation finishes
+    with ExitStack() as open_workbooks:
+        return _evaluate_criteria(
+            parsed_response, criteria, output_files, run_dir, open_workbooks
+        )
+
+
+def _evaluate_criteria(
+    parsed_response: dict[str, Any],
+    criteria: dict[str, RubricCriterion],
+    output_files: list[str] | None,
+    run_dir: Path | None,
+    open_workbooks: ExitStack,
+) -> tuple[list[CriterionResult], bool]:
     results: list[CriterionResult] = []
     gate_failed = False
+    workbooks: dict[Path, Any] = {}
 
     for criterion_id, criterion in criteria.items():
         match_type = criterion.get("match_type") or "unknown"
@@ -251,7 +288,7 @@ def _evaluate_programmatic_criteria(
 
         if match_type == "excel_cell_value":
             passed, actual_value, details, expected = _evaluate_excel_cell(
-                criterion, output_files, run_dir
+                criterion, output_files, run_dir, workbooks, open_workbooks
             )
 
         elif match_type == "excel_formatting":
@@ -838,7 +875,7 @@ def score_run(responses_dir: Path, scores_dir: Path, args):
             # Save blocked score
             score_data = {
                 "task_id": task_id,
-                "rubric_hash": get_rubric_hash(task.rubric) if task else "unknown",
+                "rubric_hash": task.rubric_hash if task else "unknown",
                 "scored_at": datetime.now().isoformat(),
                 "passed": False,
                 "blocked": True,
@@ -846,6 +883,7 @@ def score_run(responses_dir: Path, scores_dir: Path, args):
                 "points_earned": 0,
                 "score_percent": 0,
                 "criteria": [],
+                "response_summary": summarize_response(response_data),
             }
             with open(score_file, "w") as f:
                 json.dump(score_data, f, indent=2)
@@ -974,7 +1012,7 @@ def score_run(responses_dir: Path, scores_dir: Path, args):
 
         score_data = {
             "task_id": score.task_id,
-            "rubric_hash": get_rubric_hash(task.rubric),
+            "rubric_hash": task.rubric_hash,
             "scored_at": datetime.now().isoformat(),
             "passed": score.passed,
             "total_points": score.total_points,
@@ -982,6 +1020,7 @@ def score_run(responses_dir: Path, scores_dir: Path, args):
             "score_percent": score.score_percent,
             "llm_gated": score.llm_gated,
             "criteria": criteria_data,
+            "response_summary": summarize_response(response_data),
         }
         if judge_field:
             score_data["judge"] = judge_field
@@ -1090,7 +1129,11 @@ def main():
         print(f"\n{'=' * 60}")
         print(f"Scoring run: {run_id}")
         print(f"{'=' * 60}")
-        score_run(responses_dir, scores_dir, args)
+        try:
+            score_run(responses_dir, scores_dir, args)
+        finally:
+            # Judge uploads are reused within a run; remove them before the next
+            delete_judge_uploads()
 
 
 if __name__ == "__main__":
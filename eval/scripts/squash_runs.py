@@ -14,6 +14,7 @@ Examples:
 import argparse
 import json
 import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -123,7 +124,7 @@ def main():
         out_model, out_run_id = out_parts
         output_path = responses_dir / out_model / out_run_id
     else:
-        out_run_id = datetime.now().strftime("%Y%m%d_%H%M%S") + "_squashed"
+        out_run_id = time.strftime("%Y%m%d_%H%M%S") + "_squashed"
         output_path = responses_dir / model / out_run_id
 
     if output_path.exists():
@@ -9,8 +9,9 @@ import yaml
 REPO_ROOT = Path(__file__).resolve().parents[1]
 EVAL_DIR = REPO_ROOT / "eval"
 LLM_JUDGE_DIR = EVAL_DIR / "llm-judge"
+EXPORT_SCRIPTS_DIR = EVAL_DIR / "export-scripts"
 
-for path in (REPO_ROOT, EVAL_DIR, LLM_JUDGE_DIR):
+for path in (REPO_ROOT, EVAL_DIR, LLM_JUDGE_DIR, EXPORT_SCRIPTS_DIR):
     if str(path) not in sys.path:
         sys.path.insert(0, str(path))
 
@@ -3,6 +3,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from eval.helpers import get_rubric_hash
 from eval.score import score_run
 
 
@@ -33,3 +34,9 @@ def test_score_run_writes_scores_only(tmp_path, task_factory, sample_rubric, sco
     data = json.loads(score_file.read_text())
     assert data["task_id"] == "e-000"
     assert data["passed"] is True
+    assert data["rubric_hash"] == get_rubric_hash(sample_rubric)
+    assert data["response_summary"] == {
+        "latency_ms": None,
+        "stop_reason": "end_turn",
+        "parse_failed": False,
+    }
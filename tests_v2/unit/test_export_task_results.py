@@ -0,0 +1,121 @@
+import json
+import os
+
+import pytest
+
+import export_task_results  # type: ignore
+from export_task_results import get_model_results  # type: ignore
+
+MODEL = "claude-test"
+RUN_ID = "20250101_120000"
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+    return path
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def results_tree(tmp_path):
+    scores_dir = tmp_path / "scores"
+    responses_dir = tmp_path / "responses"
+    _write_json(
+        scores_dir / MODEL / RUN_ID / "e-001.json",
+        {
+            "score_percent": 100,
+            "response_summary": {
+                "latency_ms": 1200.4,
+                "stop_reason": "end_turn",
+                "parse_failed": False,
+            },
+        },
+    )
+    # Older score file without a response_summary
+    _write_json(scores_dir / MODEL / RUN_ID / "e-002.json", {"score_percent": 40})
+    _write_json(
+        responses_dir / MODEL / RUN_ID / "e-002.json",
+        {"usage": {"latency_ms": 900}, "stop_reason": "end_turn"},
+    )
+    _write_json(responses_dir / MODEL / RUN_ID / "config.json", {"provider": "x"})
+    return scores_dir, responses_dir, tmp_path / "cache"
+
+
+def _results(results_tree):
+    scores_dir, responses_dir, cache_dir = results_tree
+    results = get_model_results(
+        scores_dir / MODEL, scores_dir, responses_dir, cache_dir=cache_dir
+    )
+    return {r["task_id"]: r for r in results}
+
+
+def _count_loads(monkeypatch):
+    calls = []
+    load = export_task_results._load_result_files
+
+    def counting_load(score_file, response_file):
+        calls.append(score_file)
+        return load(score_file, response_file)
+
+    monkeypatch.setattr(export_task_results, "_load_result_files", counting_load)
+    return calls
+
+
+@pytest.mark.unit
+def test_get_model_results_warm_cache_matches_cold(results_tree, monkeypatch):
+    cold = _results(results_tree)
+    assert cold["e-001"]["score"] == 100
+    assert cold["e-001"]["execution_time_ms"] == 1200
+    assert cold["e-002"]["execution_time_ms"] == 900
+    assert cold["e-002"]["error_type"] == "other_error"
+
+    calls = _count_loads(monkeypatch)
+    assert _results(results_tree) == cold
+    assert calls == []
+
+
+@pytest.mark.unit
+def test_get_model_results_rebuilds_on_score_change(results_tree):
+    scores_dir = results_tree[0]
+    _results(results_tree)
+
+    score_file = _write_json(
+        scores_dir / MODEL / RUN_ID / "e-001.json", {"score_percent": 50}
+    )
+    _touch_later(score_file)
+
+    assert _results(results_tree)["e-001"]["score"] == 50
+
+
+@pytest.mark.unit
+def test_get_model_results_rebuilds_on_response_change(results_tree):
+    responses_dir = results_tree[1]
+    _results(results_tree)
+
+    response_file = _write_json(
+        responses_dir / MODEL / RUN_ID / "e-002.json",
+        {"usage": {"latency_ms": 300}, "stop_reason": "end_turn"},
+    )
+    _touch_later(response_file)
+
+    assert _results(results_tree)["e-002"]["execution_time_ms"] == 300
+
+
+@pytest.mark.unit
+def test_get_model_results_rebuilds_on_version_bump(results_tree, monkeypatch):
+    _results(results_tree)
+
+    monkeypatch.setattr(
+        export_task_results,
+        "RESULTS_CACHE_VERSION",
+        export_task_results.RESULTS_CACHE_VERSION + 1,
+    )
+    calls = _count_loads(monkeypatch)
+    _results(results_tree)
+
+    assert len(calls) == 2
@@ -1,9 +1,14 @@
+import os
 from pathlib import Path
 
 import openpyxl
 import pytest
 
-from eval.helpers import check_cell_value, check_formatting_conventions
+from eval.helpers import (
+    check_cell_value,
+    check_formatting_conventions,
+    check_workbook_errors,
+)
 
 
 @pytest.mark.unit
@@ -46,6 +51,21 @@ def test_check_cell_value_missing_sheet(tmp_path):
     assert "Sheet 'Missing' not found" in details
 
 
+@pytest.mark.unit
+def test_check_workbook_errors_reports_coordinates(tmp_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A1"].value = 1
+    clean_path = tmp_path / "clean.xlsx"
+    wb.save(clean_path)
+    assert check_workbook_errors(clean_path) == (False, [])
+
+    ws["C3"].value = "#REF!"
+    broken_path = tmp_path / "broken.xlsx"
+    wb.save(broken_path)
+    assert check_workbook_errors(broken_path) == (True, ["Sheet!C3: #REF!"])
+
+
 @pytest.mark.unit
 def test_check_formatting_conventions_detects_violation(tmp_path):
     wb = openpyxl.Workbook()
@@ -58,3 +78,37 @@ def test_check_formatting_conventions_detects_violation(tmp_path):
     passed, violations = check_formatting_conventions(file_path, cells=["C3"])
     assert passed is False
     assert any("hardcoded number should be blue" in v for v in violations)
+
+
+@pytest.mark.unit
+def test_check_formatting_conventions_sees_rewritten_file(tmp_path):
+    file_path = tmp_path / "format.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active["C3"].value = 100
+    wb.save(file_path)
+    assert check_formatting_conventions(file_path, cells=["C3"])[0] is False
+
+    wb.active["C3"].font = openpyxl.styles.Font(color="FF0000FF")
+    wb.save(file_path)
+    os.utime(file_path, ns=(0, 0))
+
+    assert check_formatting_conventions(file_path, cells=["C3"]) == (True, [])
+
+
+@pytest.mark.unit
+def test_check_formatting_conventions_classifies_formula_refs(tmp_path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A1"].value = "=Other!B2"
+    ws["A2"].value = "=[Model.xlsx]Other!B2"
+    ws["A2"].font = openpyxl.styles.Font(color="FF0000FF")
+    ws["A3"].value = "=SUM(B1:B2)"
+    file_path = tmp_path / "refs.xlsx"
+    wb.save(file_path)
+
+    passed, violations = check_formatting_conventions(file_path)
+    assert passed is False
+    assert violations == [
+        "A1: cross-sheet ref should be green",
+        "A2: external workbook ref should be red",
+    ]
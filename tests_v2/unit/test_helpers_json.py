@@ -1,8 +1,10 @@
 import json
+from types import SimpleNamespace
 
 import pytest
 
 from eval.helpers import (
+    extract_error_details,
     extract_json,
     extract_task_section,
     get_rubric_hash,
@@ -29,6 +31,18 @@ def test_extract_json_partial_object_closes_brace():
     assert extract_json(text) == {"answer": "OK"}
 
 
+@pytest.mark.unit
+def test_extract_json_ignores_braces_inside_strings():
+    text = 'Result: {"answer": "use {x} or }", "note": "a \\"}\\" b"} done'
+    assert extract_json(text) == {"answer": "use {x} or }", "note": 'a "}" b'}
+
+
+@pytest.mark.unit
+def test_extract_json_leading_comment_line():
+    text = '// notes: {draft}\n{"answer": "OK"}'
+    assert extract_json(text) == {"answer": "OK"}
+
+
 @pytest.mark.unit
 def test_extract_task_section_returns_content():
     prompt = "# Title\n\n## Task\nDo the thing\n\n## Output\nJSON"
@@ -63,3 +77,79 @@ def test_retry_on_rate_limit_retries_then_succeeds(mocker):
     assert wrapped() == "ok"
     assert calls["count"] == 3
     assert sleeper.call_count == 2
+
+
+@pytest.mark.unit
+def test_retry_on_rate_limit_honours_retry_after(mocker):
+    calls = {"count": 0}
+
+    class RateLimitError(Exception):
+        response = SimpleNamespace(headers={"retry-after": "2"})
+
+    def limited():
+        calls["count"] += 1
+        if calls["count"] < 2:
+            raise RateLimitError("429 rate limit")
+        return "ok"
+
+    sleeper = mocker.patch("eval.helpers.time.sleep")
+
+    wrapped = retry_on_rate_limit(max_retries=3, initial_wait=60)(limited)
+    assert wrapped() == "ok"
+    sleeper.assert_called_once_with(2.0)
+
+
+@pytest.mark.unit
+def test_retry_on_rate_limit_uses_status_code_attribute(mocker):
+    calls = {"count": 0}
+
+    class APIStatusError(Exception):
+        status_code = 503
+
+    def unavailable():
+        calls["count"] += 1
+        if calls["count"] < 2:
+            raise APIStatusError("upstream said no")
+        return "ok"
+
+    sleeper = mocker.patch("eval.helpers.time.sleep")
+
+    wrapped = retry_on_rate_limit(max_retries=3, initial_wait=1)(unavailable)
+    assert wrapped() == "ok"
+    sleeper.assert_called_once_with(1)
+
+
+@pytest.mark.unit
+def test_retry_on_rate_limit_uses_int_code_attribute(mocker):
+    calls = {"count": 0}
+
+    class ClientError(Exception):
+        code = 429
+
+    def exhausted():
+        calls["count"] += 1
+        if calls["count"] < 2:
+            raise ClientError("RESOURCE_EXHAUSTED")
+        return "ok"
+
+    mocker.patch("eval.helpers.time.sleep")
+    mocker.patch("eval.helpers._rate_limited_until", {})
+
+    wrapped = retry_on_rate_limit(max_retries=3, initial_wait=1)(exhausted)
+    assert wrapped() == "ok"
+    assert calls["count"] == 2
+
+
+@pytest.mark.unit
+def test_extract_error_details_falls_back_to_response():
+    error = RuntimeError("boom")
+    error.status_code = 429
+    error.response = SimpleNamespace(
+        status_code=500, headers={"request-id": "req_1"}, text="x" * 3000
+    )
+
+    details = extract_error_details(error)
+
+    assert details["status_code"] == 429
+    assert details["request_id"] == "req_1"
+    assert len(details["response_body"]) == 2000
@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+from eval.helpers import TASK_META_CACHE, load_task, load_task_meta_index, load_tasks
+
+
+def _write_meta(tasks_dir, task_id, category):
+    task_dir = tasks_dir / task_id
+    task_dir.mkdir(exist_ok=True)
+    meta_path = task_dir / "meta.yaml"
+    meta_path.write_text(f"task:\n  id: {task_id}\n  category: {category}\n")
+    return meta_path
+
+
+@pytest.mark.unit
+def test_load_task_meta_index_writes_and_reuses_cache(tmp_path):
+    _write_meta(tmp_path, "e-001", "modeling")
+    (tmp_path / "e-002").mkdir()
+    (tmp_path / "e-003").mkdir()
+    (tmp_path / "e-003" / "meta.yaml").write_text("# placeholder\n")
+
+    index = load_task_meta_index(tmp_path)
+    assert index == {"e-001": {"task": {"id": "e-001", "category": "modeling"}}}
+    assert (tmp_path / TASK_META_CACHE).exists()
+
+    assert load_task_meta_index(tmp_path) == index
+
+
+@pytest.mark.unit
+def test_load_task_meta_index_rebuilds_torn_cache(tmp_path):
+    _write_meta(tmp_path, "e-001", "modeling")
+    (tmp_path / TASK_META_CACHE).write_bytes(b'{"mtimes": {"e-001": \xff')
+
+    index = load_task_meta_index(tmp_path)
+    assert index == {"e-001": {"task": {"id": "e-001", "category": "modeling"}}}
+    assert json.loads((tmp_path / TASK_META_CACHE).read_bytes())["meta"] == index
+    assert [p.name for p in tmp_path.iterdir() if p.is_file()] == [TASK_META_CACHE]
+
+
+@pytest.mark.unit
+def test_load_task_meta_index_same_types_cold_and_warm(tmp_path):
+    (tmp_path / "e-001").mkdir()
+    (tmp_path / "e-001" / "meta.yaml").write_text(
+        "task:\n  id: e-001\n  created: 2025-01-01\n"
+    )
+
+    cold = load_task_meta_index(tmp_path)
+    assert cold["e-001"]["task"]["created"] == "2025-01-01"
+    assert load_task_meta_index(tmp_path) == cold
+
+
+@pytest.mark.unit
+def test_load_task_meta_index_rebuilds_on_change(tmp_path):
+    meta_path = _write_meta(tmp_path, "e-001", "modeling")
+    load_task_meta_index(tmp_path)
+
+    _write_meta(tmp_path, "e-001", "valuation")
+    stat = meta_path.stat()
+    os.utime(meta_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    _write_meta(tmp_path, "m-001", "research")
+
+    index = load_task_meta_index(tmp_path)
+    assert index["e-001"]["task"]["category"] == "valuation"
+    assert index["m-001"]["task"]["category"] == "research"
+
+
+@pytest.mark.unit
+def test_load_tasks_keeps_sorted_order_and_warns(tmp_path, capsys):
+    for task_id in ["m-001", "e-002", "e-001"]:
+        _write_meta(tmp_path, task_id, "modeling")
+        (tmp_path / task_id / "prompt.md").write_text(f"prompt {task_id}")
+    (tmp_path / "e-003").mkdir()
+    (tmp_path / "e-003" / "meta.yaml").write_text("# placeholder\n")
+
+    tasks = load_tasks(tmp_path, include_rubric=False)
+
+    assert [t.id for t in tasks] == ["e-001", "e-002", "m-001"]
+    assert "Warning: Skipping e-003" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_load_task_cache_invalidates_on_change(tmp_path):
+    _write_meta(tmp_path, "e-001", "modeling")
+    prompt_path = tmp_path / "e-001" / "prompt.md"
+    prompt_path.write_text("v1")
+
+    task = load_task(tmp_path / "e-001")
+    assert load_task(tmp_path / "e-001") is task
+
+    prompt_path.write_text("v2")
+    stat = prompt_path.stat()
+    os.utime(prompt_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_task(tmp_path / "e-001").prompt == "v2"
+
+
+@pytest.mark.unit
+def test_load_task_collects_input_files_like_glob(tmp_path):
+    _write_meta(tmp_path, "e-001", "modeling")
+    task_dir = tmp_path / "e-001"
+    (task_dir / "prompt.md").write_text("prompt")
+    for name in ["input.xlsx", "input-2.pdf", "inputs", "notes.txt"]:
+        (task_dir / name).write_text("x")
+    (task_dir / "input.d").mkdir()
+
+    task = load_task(task_dir, include_rubric=False)
+
+    assert sorted(p.name for p in task.input_files) == ["input-2.pdf", "input.xlsx"]
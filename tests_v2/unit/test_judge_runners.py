@@ -1,9 +1,24 @@
 import sys
+from collections import OrderedDict
 from types import SimpleNamespace
 
 import pytest
 
-from judge_runners import AnthropicJudge, AzureJudge  # type: ignore
+from judge_runners import (  # type: ignore
+    MAX_CACHED_JUDGE_UPLOADS,
+    AnthropicJudge,
+    AzureJudge,
+    delete_judge_uploads,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_judge_state(monkeypatch):
+    """Fresh shared SDK clients and upload cache per test, cleaned up after."""
+    monkeypatch.setattr("runners.base._shared_clients", {})
+    monkeypatch.setattr("judge_runners._judge_uploads", OrderedDict())
+    yield
+    delete_judge_uploads()
 
 
 def _build_fake_anthropic(response):
@@ -74,9 +89,82 @@ def test_anthropic_judge_tools_and_cleanup(monkeypatch, tmp_path):
     assert "code_execution_20250825" in tool_types
     assert "web_search_20250305" in tool_types
     assert len(client.beta.files.uploaded_ids) == len(files)
+
+    judge.judge("prompt", files)
+    assert len(client.beta.files.uploaded_ids) == len(files)
+    assert client.beta.files.deleted_ids == []
+
+    delete_judge_uploads()
     assert client.beta.files.deleted_ids == client.beta.files.uploaded_ids
 
 
+@pytest.mark.unit
+def test_anthropic_judge_evicts_oldest_upload(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr("judge_runners.MAX_CACHED_JUDGE_UPLOADS", 1)
+    response = SimpleNamespace(content=[SimpleNamespace(text="ok")])
+    fake_module, _ = _build_fake_anthropic(response)
+    monkeypatch.setitem(sys.modules, "anthropic", fake_module)
+
+    first, second = tmp_path / "a.xlsx", tmp_path / "b.xlsx"
+    first.write_text("a")
+    second.write_text("b")
+
+    judge = AnthropicJudge(model="claude-test")
+    files = judge.client.beta.files
+    judge.judge("prompt", [first])
+    judge.judge("prompt", [second])
+
+    assert files.uploaded_ids == ["file_1", "file_2"]
+    assert files.deleted_ids == ["file_1"]
+
+
+@pytest.mark.unit
+def test_anthropic_judge_keeps_uploads_until_request_sent(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    response = SimpleNamespace(content=[SimpleNamespace(text="ok")])
+    fake_module, _ = _build_fake_anthropic(response)
+    monkeypatch.setitem(sys.modules, "anthropic", fake_module)
+
+    count = MAX_CACHED_JUDGE_UPLOADS + 4
+    paths = [tmp_path / f"input-{i}.pdf" for i in range(count)]
+    for i, path in enumerate(paths):
+        path.write_text(str(i))
+
+    judge = AnthropicJudge(model="claude-test")
+    files = judge.client.beta.files
+    deleted_at_send = []
+    monkeypatch.setattr(
+        judge.client.beta.messages,
+        "create",
+        lambda **kwargs: deleted_at_send.extend(files.deleted_ids) or response,
+    )
+    judge.judge("prompt", paths)
+
+    assert len(files.uploaded_ids) == count
+    assert deleted_at_send == []
+    assert files.deleted_ids == files.uploaded_ids[:4]
+
+
+@pytest.mark.unit
+def test_anthropic_judge_reuses_upload_for_identical_file(monkeypatch, tmp_path):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    response = SimpleNamespace(content=[SimpleNamespace(text="ok")])
+    fake_module, _ = _build_fake_anthropic(response)
+    monkeypatch.setitem(sys.modules, "anthropic", fake_module)
+
+    copies = [tmp_path / run / "output.xlsx" for run in ("run-1", "run-2")]
+    for path in copies:
+        path.parent.mkdir()
+        path.write_text("same bytes")
+
+    judge = AnthropicJudge(model="claude-test")
+    judge.judge("prompt", [copies[0]])
+    judge.judge("prompt", [copies[1]])
+
+    assert judge.client.beta.files.uploaded_ids == ["file_1"]
+
+
 class _FakeResponses:
     def __init__(self, response):
         self.calls = []
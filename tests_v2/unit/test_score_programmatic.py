@@ -1,6 +1,9 @@
+import openpyxl
 import pytest
 
+import eval.score as score_module
 from eval.score import (
+    _evaluate_programmatic_criteria,
     evaluate_regex_pattern,
     evaluate_substring_one_of,
     get_evaluation_type,
@@ -65,3 +68,24 @@ def test_score_task_gates_llm_and_skips_judge(
 
     assert score.llm_gated is True
     assert any(r.criterion_type == "llm_judge" for r in score.criteria_results)
+
+
+@pytest.mark.unit
+def test_excel_cell_criteria_share_one_workbook_load(tmp_path, mocker):
+    wb = openpyxl.Workbook()
+    wb.active["A1"].value = 10
+    wb.active["B2"].value = "ok"
+    wb.save(tmp_path / "out.xlsx")
+    criteria = {
+        "revenue": {"match_type": "excel_cell_value", "cell": "A1", "expected": 10},
+        "label": {"match_type": "excel_cell_value", "cell": "B2", "expected": "OK"},
+    }
+    loader = mocker.spy(score_module, "load_values_workbook")
+
+    results, _ = _evaluate_programmatic_criteria(
+        {}, criteria, output_files=["out.xlsx"], run_dir=tmp_path
+    )
+
+    assert [r.passed for r in results] == [True, True]
+    assert loader.call_count == 1
+    assert not loader.spy_return.read_only